@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from weakref import WeakValueDictionary
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.storage import Store
 
 from .const import (
     CONF_ACCOUNT_NUMBER,
@@ -22,6 +24,8 @@ from .const import (
     DEFAULT_FETCH_DAYS,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
 )
 from .coordinator import EnergyDataCoordinator
 
@@ -35,6 +39,24 @@ SERVICE_CLEAR_STATISTICS = "clear_statistics"
 SERVICE_REFRESH_DATA_SCHEMA = vol.Schema({})
 SERVICE_CLEAR_STATISTICS_SCHEMA = vol.Schema({})
 
+# Coordinators by config entry ID, for service handlers. hass.data holds the
+# strong reference; entries are also dropped explicitly on unload.
+_COORDINATORS: WeakValueDictionary[str, EnergyDataCoordinator] = WeakValueDictionary()
+
+
+async def async_refresh_data(call: ServiceCall) -> None:
+    """Manually refresh energy data."""
+    _LOGGER.info("Manual data refresh requested")
+    for coordinator in list(_COORDINATORS.values()):
+        await coordinator.async_manual_refresh()
+
+
+async def async_clear_statistics(call: ServiceCall) -> None:
+    """Clear all statistics and rebuild from scratch."""
+    _LOGGER.info("Clear statistics requested")
+    for coordinator in list(_COORDINATORS.values()):
+        await coordinator.async_clear_statistics()
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HSV Utilities Energy from a config entry."""
@@ -72,19 +94,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Store coordinator in hass.data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    _COORDINATORS[entry.entry_id] = coordinator
 
     # Register service to manually refresh data
-    async def async_refresh_data(call: ServiceCall) -> None:
-        """Manually refresh energy data."""
-        _LOGGER.info("Manual data refresh requested")
-        await coordinator.async_request_refresh()
-
-    # Register service to clear and rebuild statistics
-    async def async_clear_statistics(call: ServiceCall) -> None:
-        """Clear all statistics and rebuild from scratch."""
-        _LOGGER.info("Clear statistics requested")
-        await coordinator.async_clear_statistics()
-
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_DATA):
         hass.services.async_register(
             DOMAIN,
@@ -93,6 +105,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             schema=SERVICE_REFRESH_DATA_SCHEMA,
         )
 
+    # Register service to clear and rebuild statistics
     if not hass.services.has_service(DOMAIN, SERVICE_CLEAR_STATISTICS):
         hass.services.async_register(
             DOMAIN,
@@ -116,6 +129,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Remove coordinator from hass.data
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        _COORDINATORS.pop(entry.entry_id, None)
+        await coordinator.async_close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted data cache of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import time
 from typing import Any, Optional
 
 import aiohttp
+import orjson
 
 
 def _build_threaded_connector() -> aiohttp.TCPConnector:
@@ -16,6 +19,52 @@ def _build_threaded_connector() -> aiohttp.TCPConnector:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Response keys the auth endpoint may use for the token, in priority order
+ACCESS_TOKEN_KEYS = (
+    "access_token",
+    "accessToken",
+    "authorizationToken",
+    "authorization_token",
+)
+
+# Seconds before a reported token expiry at which to re-authenticate
+TOKEN_EXPIRY_MARGIN = 60
+
+# Upper bound for a single backoff sleep while polling for pending data
+MAX_POLL_DELAY = 30
+
+# Seconds to reuse a completed usage response for an identical request;
+# request windows are compared at hour granularity. Only windows ending by
+# the start of the current hour are cached, since its totals still change
+USAGE_CACHE_TTL = 600
+MS_PER_HOUR = 3_600_000
+
+
+def _backoff_delay(retry_delay: float, attempt: int) -> float:
+    """Return an exponentially growing, jittered delay for a polling attempt."""
+    delay = min(retry_delay * (2 ** (attempt - 1)), MAX_POLL_DELAY)
+    return delay * (0.5 + random.random())
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body straight from its raw bytes.
+
+    Usage payloads can be large; decoding the bytes directly avoids the
+    intermediate text copy that ``ClientResponse.json()`` makes.
+    """
+    return orjson.loads(await response.read())
+
+
+def _retry_after(response: aiohttp.ClientResponse) -> float | None:
+    """Return the server's Retry-After delay in seconds, if it sent one."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
 
 class UtilityAPIClient:
     """Async client for interacting with HSV Utility SmartHub API."""
@@ -34,12 +83,19 @@ class UtilityAPIClient:
         self._session = session
         self._own_session = session is None
         self.access_token: Optional[str] = None
+        # Monotonic deadline for the token, when the server reports a lifetime
+        self._token_expires: Optional[float] = None
+        # The bearer token is sent per request rather than stored on the
+        # session, so a session shared with the rest of Home Assistant
+        # never carries our credentials
+        self._usage_headers = {"Content-Type": "application/json"}
+        # (request key) -> (monotonic time stored, response)
+        self._usage_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
         if self._own_session:
-            # Use threaded resolver to dodge aiodns Channel.getaddrinfo signature errors in this container
-            self._session = aiohttp.ClientSession(connector=_build_threaded_connector())
+            self._ensure_session()
         return self
 
     async def __aexit__(self, *args):
@@ -47,6 +103,14 @@ class UtilityAPIClient:
         if self._own_session and self._session:
             await self._session.close()
 
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating a private one if none was given."""
+        if not self._session:
+            # Use threaded resolver to dodge aiodns Channel.getaddrinfo signature errors in this container
+            self._session = aiohttp.ClientSession(connector=_build_threaded_connector())
+            self._own_session = True
+        return self._session
+
     async def authenticate(self) -> bool:
         """Authenticate with the utility provider's OAuth endpoint."""
         payload = {"userId": self.username, "password": self.password}
@@ -54,52 +118,50 @@ class UtilityAPIClient:
         try:
             _LOGGER.debug("Authenticating with %s", self.auth_url)
 
-            if not self._session:
-                self._session = aiohttp.ClientSession(
-                    connector=_build_threaded_connector()
-                )
-                self._own_session = True
-
+            session = self._ensure_session()
             headers = {
                 "Content-Type": "application/x-www-form-urlencoded",
                 "Accept": "application/json",
                 "User-Agent": "HomeAssistant-HSV-Utilities/0.1",
             }
 
-            async with self._session.post(
+            async with session.post(
                 self.auth_url,
                 data=payload,
                 headers=headers,
             ) as response:
                 status = response.status
-                text = await response.text()
+                # Raw bytes: parsed directly, decoded to text only for errors
+                body = await response.read()
 
                 if status != 200:
                     _LOGGER.error(
                         "Authentication failed. status=%s body=%s",
                         status,
-                        text.strip(),
+                        body.decode(errors="replace").strip(),
                     )
                     return False
 
-                # Parse JSON if possible
+                # Parse JSON if possible (from the body already read above)
                 try:
-                    auth_response = await response.json()
-                except Exception:
+                    auth_response = orjson.loads(body)
+                except orjson.JSONDecodeError:
                     _LOGGER.error(
                         "Authentication response not JSON. status=%s body=%s",
                         status,
-                        text.strip(),
+                        body.decode(errors="replace").strip(),
                     )
                     return False
 
                 # Extract access token if present (API can return authorizationToken)
                 if isinstance(auth_response, dict):
-                    self.access_token = (
-                        auth_response.get("access_token")
-                        or auth_response.get("accessToken")
-                        or auth_response.get("authorizationToken")
-                        or auth_response.get("authorization_token")
+                    self.access_token = next(
+                        (
+                            auth_response[key]
+                            for key in ACCESS_TOKEN_KEYS
+                            if auth_response.get(key)
+                        ),
+                        None,
                     )
 
                 if not self.access_token:
@@ -110,15 +172,32 @@ class UtilityAPIClient:
                     return False
 
                 _LOGGER.info("Authentication successful; token obtained")
-                self._session.headers.update(
-                    {"Authorization": f"Bearer {self.access_token}"}
+                expires_in = auth_response.get("expires_in") or auth_response.get(
+                    "expiresIn"
                 )
+                self._token_expires = (
+                    time.monotonic() + float(expires_in) - TOKEN_EXPIRY_MARGIN
+                    if isinstance(expires_in, (int, float))
+                    else None
+                )
+                self._usage_headers = {
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.access_token}",
+                }
                 return True
 
         except Exception as err:
             _LOGGER.exception("Error during authentication: %s", err)
             return False
 
+    async def ensure_authenticated(self) -> bool:
+        """Authenticate unless a still-valid access token is already held."""
+        if self.access_token and (
+            self._token_expires is None or time.monotonic() < self._token_expires
+        ):
+            return True
+        return await self.authenticate()
+
     async def get_usage_data(
         self,
         service_location_number: str,
@@ -129,7 +208,9 @@ class UtilityAPIClient:
         industries: list[str] | None = None,
         include_demand: bool = False,
         max_retries: int = 10,
-        retry_delay: int = 2,
+        retry_delay: float = 1,
+        max_poll_time: float = 60,
+        use_cache: bool = True,
     ) -> dict[str, Any] | None:
         """Retrieve energy usage data from the utility API.
 
@@ -142,7 +223,11 @@ class UtilityAPIClient:
             industries: List of industries to query (WATER, GAS, ELECTRIC)
             include_demand: Whether to include demand data
             max_retries: Maximum number of polling attempts
-            retry_delay: Seconds to wait between polling attempts
+            retry_delay: Initial seconds to wait between polling attempts; the
+                delay doubles (with jitter) on each attempt
+            max_poll_time: Maximum seconds to spend polling for pending data
+            use_cache: Whether a recent response for the same finalized window
+                may be reused instead of querying the API
 
         Returns:
             Usage data response from API or None on error
@@ -150,6 +235,23 @@ class UtilityAPIClient:
         if industries is None:
             industries = ["ELECTRIC", "GAS"]
 
+        cache_key = (
+            service_location_number,
+            account_number,
+            start_datetime // MS_PER_HOUR,
+            end_datetime // MS_PER_HOUR,
+            tuple(industries),
+            time_frame,
+            include_demand,
+        )
+        # Windows reaching into the current hour are never cached
+        current_hour_ms = int(time.time() * 1000) // MS_PER_HOUR * MS_PER_HOUR
+        cacheable = end_datetime <= current_hour_ms
+        cached = self._usage_cache.get(cache_key) if use_cache and cacheable else None
+        if cached is not None and time.monotonic() - cached[0] < USAGE_CACHE_TTL:
+            _LOGGER.debug("Using cached usage data for %s", industries)
+            return cached[1]
+
         usage_url = f"{self.base_url}/services/secured/utility-usage/poll"
 
         payload = {
@@ -172,19 +274,18 @@ class UtilityAPIClient:
                 end_datetime,
             )
 
-            if not self._session:
-                self._session = aiohttp.ClientSession(
-                    connector=_build_threaded_connector()
-                )
-                self._own_session = True
+            session = self._ensure_session()
 
             # Initial request
-            async with self._session.post(
+            async with session.post(
                 usage_url,
                 json=payload,
-                headers={"Content-Type": "application/json"},
+                headers=self._usage_headers,
             ) as response:
                 if response.status != 200:
+                    if response.status == 401:
+                        # Token rejected; authenticate again on the next call
+                        self.access_token = None
                     _LOGGER.error(
                         "Failed to retrieve usage data. Status: %s, Response: %s",
                         response.status,
@@ -192,30 +293,53 @@ class UtilityAPIClient:
                     )
                     return None
 
-                data = await response.json()
+                data = await _read_json(response)
+                retry_after = _retry_after(response)
 
-            # Poll until data is ready
+            # Poll until data is ready, backing off exponentially with jitter
+            # (or as instructed by Retry-After) within the polling time budget
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + max_poll_time
             retry_count = 0
             while data.get("status") == "PENDING" and retry_count < max_retries:
-                retry_count += 1
-                _LOGGER.debug("Data pending, retry %d/%d", retry_count, max_retries)
-                await asyncio.sleep(retry_delay)
+                attempt = retry_count + 1
+                delay = (
+                    retry_after
+                    if retry_after is not None
+                    else _backoff_delay(retry_delay, attempt)
+                )
+                if loop.time() + delay > deadline:
+                    break
+                _LOGGER.debug(
+                    "Data pending, retry %d/%d in %.1fs",
+                    attempt,
+                    max_retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
 
                 # Poll again
-                async with self._session.post(
+                async with session.post(
                     usage_url,
                     json=payload,
-                    headers={"Content-Type": "application/json"},
+                    headers=self._usage_headers,
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _read_json(response)
+                        retry_after = _retry_after(response)
+                        # Counted once made, so a deadline break reports
+                        # only the polls actually sent
+                        retry_count = attempt
                     else:
+                        if response.status == 401:
+                            # Token rejected; authenticate again on the next call
+                            self.access_token = None
                         _LOGGER.error("Polling failed with status %s", response.status)
                         return None
 
             # Check final status
             if data.get("status") == "PENDING":
-                _LOGGER.warning("Data still pending after %d attempts", max_retries)
+                _LOGGER.warning("Data still pending after %d attempts", retry_count)
                 return None
             elif (
                 data.get("status") == "COMPLETE"
@@ -223,6 +347,14 @@ class UtilityAPIClient:
                 or len(data.keys()) > 1
             ):
                 _LOGGER.info("Usage data retrieved successfully")
+                now = time.monotonic()
+                self._usage_cache = {
+                    key: entry
+                    for key, entry in self._usage_cache.items()
+                    if now - entry[0] < USAGE_CACHE_TTL
+                }
+                if cacheable:
+                    self._usage_cache[cache_key] = (now, data)
                 return data
             else:
                 _LOGGER.warning(
@@ -238,3 +370,4 @@ class UtilityAPIClient:
         """Close the session."""
         if self._own_session and self._session:
             await self._session.close()
+            self._session = None
@@ -11,6 +11,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
+from .api_client import UtilityAPIClient
 from .const import (
     CONF_ACCOUNT_NUMBER,
     CONF_DATA_PATH,
@@ -29,6 +30,33 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+UTILITY_TYPE_OPTIONS = {"ELECTRIC": "Electric", "GAS": "Gas", "WATER": "Water"}
+
+# Schemas are built once; forms are pre-filled via suggested values
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=300, max=86400)
+        ),
+        vol.Optional(CONF_FETCH_DAYS, default=DEFAULT_FETCH_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=30)
+        ),
+        vol.Optional(
+            CONF_UTILITY_TYPES, default=DEFAULT_UTILITY_TYPES
+        ): cv.multi_select(UTILITY_TYPE_OPTIONS),
+    }
+)
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): cv.string,
+        vol.Required(CONF_PASSWORD): cv.string,
+        vol.Required(CONF_SERVICE_LOCATION): cv.string,
+        vol.Required(CONF_ACCOUNT_NUMBER): cv.string,
+        vol.Optional(CONF_DATA_PATH, default=DEFAULT_DATA_PATH): cv.string,
+    }
+).extend(OPTIONS_SCHEMA.schema)
+
 
 async def validate_credentials(
     hass: HomeAssistant,
@@ -41,8 +69,6 @@ async def validate_credentials(
 
     Returns dict with 'title' on success, raises ValueError on failure.
     """
-    from .api_client import UtilityAPIClient
-
     try:
         async with UtilityAPIClient(username, password) as client:
             if not await client.authenticate():
@@ -90,54 +116,11 @@ class HSVUtilitiesEnergyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input,
                 )
 
-        # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_USERNAME,
-                    default=user_input.get(CONF_USERNAME) if user_input else "",
-                ): cv.string,
-                vol.Required(
-                    CONF_PASSWORD,
-                    default=user_input.get(CONF_PASSWORD) if user_input else "",
-                ): cv.string,
-                vol.Required(
-                    CONF_SERVICE_LOCATION,
-                    default=user_input.get(CONF_SERVICE_LOCATION) if user_input else "",
-                ): cv.string,
-                vol.Required(
-                    CONF_ACCOUNT_NUMBER,
-                    default=user_input.get(CONF_ACCOUNT_NUMBER) if user_input else "",
-                ): cv.string,
-                vol.Optional(
-                    CONF_DATA_PATH,
-                    default=user_input.get(CONF_DATA_PATH, DEFAULT_DATA_PATH)
-                    if user_input
-                    else DEFAULT_DATA_PATH,
-                ): cv.string,
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL,
-                    default=user_input.get(
-                        CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                    )
-                    if user_input
-                    else DEFAULT_UPDATE_INTERVAL,
-                ): vol.All(vol.Coerce(int), vol.Range(min=300, max=86400)),
-                vol.Optional(
-                    CONF_FETCH_DAYS,
-                    default=user_input.get(CONF_FETCH_DAYS, DEFAULT_FETCH_DAYS)
-                    if user_input
-                    else DEFAULT_FETCH_DAYS,
-                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=30)),
-                vol.Optional(
-                    CONF_UTILITY_TYPES,
-                    default=user_input.get(CONF_UTILITY_TYPES, DEFAULT_UTILITY_TYPES)
-                    if user_input
-                    else DEFAULT_UTILITY_TYPES,
-                ): cv.multi_select(
-                    {"ELECTRIC": "Electric", "GAS": "Gas", "WATER": "Water"}
-                ),
-            }
+        # Show form, pre-filled with anything the user already entered
+        data_schema = (
+            self.add_suggested_values_to_schema(STEP_USER_DATA_SCHEMA, user_input)
+            if user_input
+            else STEP_USER_DATA_SCHEMA
         )
 
         return self.async_show_form(
@@ -170,35 +153,20 @@ class HSVUtilitiesEnergyOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
             )
             return self.async_create_entry(title="", data={})
 
-        # Get current values
-        current_interval = self.config_entry.data.get(
-            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-        )
-        current_fetch_days = self.config_entry.data.get(
-            CONF_FETCH_DAYS, DEFAULT_FETCH_DAYS
-        )
-        current_utilities = self.config_entry.data.get(
-            CONF_UTILITY_TYPES, DEFAULT_UTILITY_TYPES
-        )
-
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA,
                 {
-                    vol.Optional(
-                        CONF_UPDATE_INTERVAL,
-                        default=current_interval,
-                    ): vol.All(vol.Coerce(int), vol.Range(min=300, max=86400)),
-                    vol.Optional(
-                        CONF_FETCH_DAYS,
-                        default=current_fetch_days,
-                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=30)),
-                    vol.Optional(
-                        CONF_UTILITY_TYPES,
-                        default=current_utilities,
-                    ): cv.multi_select(
-                        {"ELECTRIC": "Electric", "GAS": "Gas", "WATER": "Water"}
+                    CONF_UPDATE_INTERVAL: self.config_entry.data.get(
+                        CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+                    ),
+                    CONF_FETCH_DAYS: self.config_entry.data.get(
+                        CONF_FETCH_DAYS, DEFAULT_FETCH_DAYS
+                    ),
+                    CONF_UTILITY_TYPES: self.config_entry.data.get(
+                        CONF_UTILITY_TYPES, DEFAULT_UTILITY_TYPES
                     ),
-                }
+                },
             ),
         )
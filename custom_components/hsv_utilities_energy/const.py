@@ -24,9 +24,24 @@ DEFAULT_UPDATE_INTERVAL: Final = (
 DEFAULT_FETCH_DAYS: Final = 30  # Fetch last 30 days to build up history
 DEFAULT_UTILITY_TYPES: Final = ["ELECTRIC", "GAS"]
 
+# Once data is cached, fetch only from the latest cached sample onwards,
+# re-fetching this much overlap in case recent hours were revised
+FETCH_OVERLAP: Final = timedelta(hours=6)
+# With nothing cached but statistics recorded, still fetch at least this much
+# so the sensors' today/yesterday totals are complete
+COLD_START_FETCH: Final = timedelta(days=2)
+
 # Update interval
 UPDATE_INTERVAL = timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
 
+# Statistics import
+STATISTICS_IMPORT_CHUNK_SIZE: Final = 168  # One week of hourly statistics
+
+# Persistent cache storage (one store per config entry, keyed by entry ID)
+STORAGE_KEY: Final = f"{DOMAIN}.cache"
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 30  # Seconds to batch cache writes
+
 # Sensor types
 SENSOR_TYPES = {
     "electric_usage": {
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.components.recorder import get_instance
@@ -14,19 +20,62 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api_client import UtilityAPIClient
 from .const import (
+    COLD_START_FETCH,
     DATA_TYPE_COST,
     DATA_TYPE_USAGE,
     DOMAIN,
+    FETCH_OVERLAP,
+    STATISTICS_IMPORT_CHUNK_SIZE,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
     UTILITY_TYPE_ELECTRIC,
 )
 from .delta_storage import EnergyDataCache
 
 _LOGGER = logging.getLogger(__name__)
 
+MS_PER_DAY = 86_400_000
+
+
+def _statistic_id(utility_type: str, data_type: str) -> str:
+    """Return the external statistic ID (domain:id format) for a data series."""
+    return f"{DOMAIN}:{utility_type.lower()}_{data_type.lower()}"
+
+
+def _statistic_start(stat: dict[str, Any] | None) -> datetime | None:
+    """Return the start of a statistic row as a timezone-aware UTC datetime."""
+    start = stat.get("start") if stat else None
+    if not start:
+        return None
+    # Convert to datetime if it's a timestamp
+    if isinstance(start, (int, float)):
+        return datetime.fromtimestamp(start, tz=timezone.utc)
+    if start.tzinfo is None:
+        return start.replace(tzinfo=timezone.utc)
+    return start
+
+
+@lru_cache(maxsize=32)
+def _statistic_metadata(
+    statistic_id: str, utility_type: str, data_type: str, unit: str
+) -> StatisticMetaData:
+    """Build the external statistic metadata, reused across imports."""
+    return StatisticMetaData(
+        has_mean=False,
+        has_sum=True,
+        name=f"{utility_type.capitalize()} {data_type.capitalize()}",
+        source=DOMAIN,
+        statistic_id=statistic_id,
+        unit_of_measurement=unit,
+    )
+
 
 class EnergyDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching energy data from HSV Utilities API."""
@@ -59,29 +108,68 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
         self.fetch_days = fetch_days
         self.utility_types = utility_types
         self.entry_id = entry_id
-        # In-memory cache for recent data
+        # In-memory cache for recent data, persisted across restarts
         self._cache = EnergyDataCache()
-        self._api_client = None
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}"
+        )
+        self._cache_loaded = False
+        # API client keeping one private session (with the threaded DNS
+        # resolver) for the coordinator's lifetime; closed in async_close
+        self._api_client = UtilityAPIClient(username, password)
         # Flag to force rebuild of statistics (ignores existing stats)
         self._force_rebuild = False
+        # Flag to query the API even for recently fetched windows
+        self._bypass_api_cache = False
+        # Statistics import started in the background by the first refresh
+        self._import_task: asyncio.Task | None = None
+        # Last recorded statistic per statistic ID (looked up or handed to the
+        # recorder), so later imports can continue from it without querying
+        # the recorder again
+        self._last_imported: dict[str, dict[str, Any]] = {}
+
+    async def async_close(self) -> None:
+        """Stop a running statistics import and release the API client."""
+        if self._import_task is not None and not self._import_task.done():
+            self._import_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._import_task
+        await self._api_client.close()
+
+    async def _async_load_cache(self) -> None:
+        """Restore the cache saved before the last restart, if any."""
+        self._cache_loaded = True
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        try:
+            self._cache.load_dict(stored)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Discarding unreadable energy data cache: %s", err)
+
+    async def async_manual_refresh(self) -> None:
+        """Refresh data from the API, bypassing its response cache."""
+        self._bypass_api_cache = True
+        await self.async_request_refresh()
 
     async def async_clear_statistics(self) -> None:
         """Clear all statistics for this integration and force rebuild.
-        
+
         Note: We cannot directly clear statistics due to HA recorder thread restrictions.
         Instead, we force a rebuild which will overwrite existing statistics.
         """
         _LOGGER.info("Rebuilding all HSV Utilities Energy statistics from scratch")
-        
+
         # Clear the in-memory cache
         self._cache = EnergyDataCache()
-        
+
         # Set flag to force rebuild (ignores existing statistics)
         self._force_rebuild = True
-        
+        self._last_imported.clear()
+
         # Trigger a refresh to rebuild statistics
         await self.async_request_refresh()
-        
+
         _LOGGER.info("Statistics rebuild complete")
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -97,57 +185,131 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
             "GAS": {...}
         }
         """
+        # One clock reading for the whole update cycle
+        now = dt_util.utcnow()
+
+        if not self._cache_loaded:
+            await self._async_load_cache()
+
+        # Expire cached samples, including those of meters no longer reported
+        self._cache.evict_expired(now)
+
         try:
             # Step 1: Fetch data from API and store in cache
-            await self._fetch_and_store_data()
-
-            # Step 2: Import data to HA statistics
-            await self._import_to_statistics()
+            try:
+                await self._fetch_and_store_data(now)
+            finally:
+                self._bypass_api_cache = False
+            self._store.async_delay_save(self._cache.as_dict, STORAGE_SAVE_DELAY)
+
+            # Step 2: Import data to HA statistics. The first refresh runs
+            # during entry setup, so import in the background there rather
+            # than holding up setup on the recorder.
+            if self._import_task is not None and not self._import_task.done():
+                await self._import_task
+            if self.data is None:
+                self._import_task = self.hass.async_create_background_task(
+                    self._async_background_import(),
+                    f"{DOMAIN} statistics import",
+                )
+            else:
+                await self._import_to_statistics()
 
             # Step 3: Return aggregated data from cache
-            return self._read_aggregated_data()
+            return self._read_aggregated_data(now)
 
         except Exception as err:
             _LOGGER.exception("Error fetching energy data: %s", err)
             raise UpdateFailed(f"Error fetching energy data: {err}") from err
 
-    async def _fetch_and_store_data(self) -> None:
+    async def _fetch_and_store_data(self, now: datetime) -> None:
         """Fetch data from API and store in Delta Lake."""
         try:
-            # Calculate time range (fetch last N days)
-            # Use UTC to match main.py and API expectations
-            end_time = datetime.now(tz=timezone.utc)
-            start_time = end_time - timedelta(days=self.fetch_days)
-
-            # Convert to milliseconds since epoch
-            start_ms = int(start_time.timestamp() * 1000)
-            end_ms = int(end_time.timestamp() * 1000)
+            # Calculate time range (fetch last N days) in milliseconds since
+            # epoch; use UTC to match main.py and API expectations
+            end_ms = int(now.timestamp() * 1000)
+            start_ms = end_ms - self.fetch_days * MS_PER_DAY
 
             _LOGGER.info(
-                "Fetching data from %s to %s (end_ms=%d)",
-                start_time,
-                end_time,
+                "Fetching up to %d days of data ending %s (end_ms=%d)",
+                self.fetch_days,
+                now,
                 end_ms,
             )
 
-            # Initialize API client
-            if self._api_client is None:
-                self._api_client = UtilityAPIClient(self.username, self.password)
-
-            # Authenticate
-            if not await self._api_client.authenticate():
+            # Authenticate (reuses the cached token while it is valid)
+            if not await self._api_client.ensure_authenticated():
                 raise UpdateFailed("Authentication failed")
 
-            # Fetch usage data for each utility type
-            for utility_type in self.utility_types:
-                await self._fetch_utility_data(utility_type, start_ms, end_ms)
+            fetch_starts = await self._resolve_fetch_starts(start_ms, end_ms)
+
+            # Fetch usage data for each utility type concurrently; one failing
+            # utility must not abort the others
+            results = await asyncio.gather(
+                *(
+                    self._fetch_utility_data(
+                        utility_type, fetch_starts[utility_type], end_ms, now
+                    )
+                    for utility_type in self.utility_types
+                ),
+                return_exceptions=True,
+            )
+            for utility_type, result in zip(self.utility_types, results):
+                if isinstance(result, Exception):
+                    _LOGGER.warning("Error fetching %s data: %s", utility_type, result)
 
         except Exception as err:
             _LOGGER.exception("Error fetching from API: %s", err)
             raise
 
+    async def _resolve_fetch_starts(
+        self, full_start_ms: int, end_ms: int
+    ) -> dict[str, int]:
+        """Return where to start fetching each utility's data.
+
+        Once the cache holds data for a utility, only the hours since its
+        latest sample (plus an overlap for revised hours) are fetched instead
+        of the whole fetch_days window. With nothing cached, the last recorded
+        statistics bound the window the same way, but never to less than
+        COLD_START_FETCH so the sensors' daily totals can be rebuilt.
+        """
+        overlap_ms = int(FETCH_OVERLAP.total_seconds() * 1000)
+        starts: dict[str, int] = {}
+        uncached: list[str] = []
+        for utility_type in self.utility_types:
+            starts[utility_type] = full_start_ms
+            latest = self._cache.get_latest_time(utility_type)
+            if latest is None:
+                uncached.append(utility_type)
+            else:
+                starts[utility_type] = max(
+                    full_start_ms, int(latest.timestamp() * 1000) - overlap_ms
+                )
+
+        if not uncached or self._force_rebuild:
+            return starts
+
+        last_stats = await self._async_last_statistics(
+            [
+                _statistic_id(utility_type, data_type)
+                for utility_type in uncached
+                for data_type in (DATA_TYPE_USAGE, DATA_TYPE_COST)
+            ]
+        )
+        cold_start_ms = end_ms - int(COLD_START_FETCH.total_seconds() * 1000)
+        for utility_type in uncached:
+            stat_starts = [
+                _statistic_start(last_stats[_statistic_id(utility_type, data_type)])
+                for data_type in (DATA_TYPE_USAGE, DATA_TYPE_COST)
+            ]
+            if None in stat_starts:
+                continue
+            recorded_ms = int(min(stat_starts).timestamp() * 1000) - overlap_ms
+            starts[utility_type] = max(full_start_ms, min(recorded_ms, cold_start_ms))
+        return starts
+
     async def _fetch_utility_data(
-        self, utility_type: str, start_ms: int, end_ms: int
+        self, utility_type: str, start_ms: int, end_ms: int, now: datetime
     ) -> None:
         """Fetch and store data for a specific utility type."""
         try:
@@ -160,6 +322,7 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                 time_frame="HOURLY",
                 industries=[utility_type],
                 include_demand=False,
+                use_cache=not self._bypass_api_cache,
             )
 
             if not usage_data or "data" not in usage_data:
@@ -167,19 +330,21 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                 return
 
             # Store usage data in cache
-            self._store_data_sync(utility_type, usage_data)
+            self._store_data_sync(utility_type, usage_data, now)
 
         except Exception as err:
             _LOGGER.warning("Error fetching %s data: %s", utility_type, err)
 
-    def _store_data_sync(self, utility_type: str, api_data: dict) -> None:
+    def _store_data_sync(
+        self, utility_type: str, api_data: dict, now: datetime
+    ) -> None:
         """Store API data in the in-memory cache."""
         try:
             # Parse API response using SmartHub dataset structure (matches main.py)
             data_section = api_data.get("data", {})
             industry_datasets = data_section.get(utility_type, [])
 
-            if not isinstance(industry_datasets, list):
+            if not industry_datasets or not isinstance(industry_datasets, list):
                 _LOGGER.debug("No datasets for %s in API response", utility_type)
                 return
 
@@ -189,6 +354,14 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                 unit_of_measure = dataset.get("unitOfMeasure", "UNKNOWN")
                 series_list = dataset.get("series", [])
 
+                # Determine save type (USAGE or COST), once per dataset
+                save_type = (
+                    DATA_TYPE_USAGE
+                    if data_type == DATA_TYPE_USAGE
+                    or str(data_type).upper() == DATA_TYPE_USAGE
+                    else DATA_TYPE_COST
+                )
+
                 for series in series_list:
                     meter_number = series.get("meterNumber", "unknown")
                     data_points = series.get("data", [])
@@ -196,13 +369,6 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                     if not data_points:
                         continue
 
-                    # Determine save type (USAGE or COST)
-                    save_type = (
-                        DATA_TYPE_USAGE
-                        if str(data_type).upper() == DATA_TYPE_USAGE
-                        else DATA_TYPE_COST
-                    )
-
                     # Store in cache
                     records_written = self._cache.save_usage_data(
                         data=data_points,
@@ -213,112 +379,147 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                         unit_of_measure=unit_of_measure,
                         time_frame="HOURLY",
                         data_type=save_type,
+                        now=now,
                     )
-                    _LOGGER.debug(
-                        "Cached %d %s %s records for meter %s",
-                        records_written,
-                        utility_type,
-                        save_type.lower(),
-                        meter_number,
-                    )
+                    # Guarded: lower() would otherwise run per series
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Cached %d %s %s records for meter %s",
+                            records_written,
+                            utility_type,
+                            save_type.lower(),
+                            meter_number,
+                        )
 
         except Exception as err:
             _LOGGER.exception("Error storing %s data: %s", utility_type, err)
 
+    async def _async_background_import(self) -> None:
+        """Import statistics outside of a coordinator refresh."""
+        try:
+            await self._import_to_statistics()
+        except Exception as err:
+            _LOGGER.exception("Error importing energy statistics: %s", err)
+
     async def _import_to_statistics(self) -> None:
-        """Import cached data to Home Assistant statistics."""
+        """Import cached data to Home Assistant statistics.
+
+        All utility and data types share one recorder lookup for their last
+        statistics instead of a separate executor round-trip per utility.
+        """
+        # (utility_type, data_type, statistic_id, hourly_data) per import
+        imports: list[tuple[str, str, str, list[tuple[datetime, float]]]] = []
         for utility_type in self.utility_types:
-            # Import usage statistics
-            await self._import_utility_statistics(
-                utility_type=utility_type,
-                data_type=DATA_TYPE_USAGE,
+            for data_type in (DATA_TYPE_USAGE, DATA_TYPE_COST):
+                hourly_data = self._cache.get_hourly_data_for_statistics(
+                    utility_type=utility_type,
+                    data_type=data_type,
+                )
+                if not hourly_data:
+                    _LOGGER.info(
+                        "No %s %s data to import to statistics",
+                        utility_type,
+                        data_type,
+                    )
+                    continue
+                statistic_id = _statistic_id(utility_type, data_type)
+                imports.append((utility_type, data_type, statistic_id, hourly_data))
+
+        last_stats: dict[str, dict[str, Any] | None] = {}
+        if imports and not self._force_rebuild:
+            # Continue the cumulative sums from the last recorded statistics
+            last_stats = await self._async_last_statistics(
+                [statistic_id for _, _, statistic_id, _ in imports]
             )
 
-            # Import cost statistics
-            await self._import_utility_statistics(
+        for utility_type, data_type, statistic_id, hourly_data in imports:
+            await self._import_data_type_statistics(
                 utility_type=utility_type,
-                data_type=DATA_TYPE_COST,
+                data_type=data_type,
+                statistic_id=statistic_id,
+                hourly_data=hourly_data,
+                last_stat=last_stats.get(statistic_id),
             )
-        
+
         # Reset force rebuild flag after import
         self._force_rebuild = False
 
-    async def _import_utility_statistics(
+    async def _async_last_statistics(
+        self, statistic_ids: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """Return the last recorded statistic (or None) for each ID.
+
+        Statistics already known from earlier lookups or imports are reused;
+        the rest are fetched from the recorder in one executor job.
+        """
+        last_stats: dict[str, dict[str, Any] | None] = {}
+        missing_ids = []
+        for statistic_id in statistic_ids:
+            if statistic_id in self._last_imported:
+                last_stats[statistic_id] = self._last_imported[statistic_id]
+            else:
+                missing_ids.append(statistic_id)
+        if missing_ids:
+            recorded = await get_instance(self.hass).async_add_executor_job(
+                self._get_last_statistics, missing_ids
+            )
+            for statistic_id in missing_ids:
+                last_stat = (recorded.get(statistic_id) or [None])[0]
+                last_stats[statistic_id] = last_stat
+                if last_stat is not None:
+                    self._last_imported[statistic_id] = last_stat
+        return last_stats
+
+    def _get_last_statistics(
+        self, statistic_ids: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch the most recent statistic for each ID (runs in the executor)."""
+        last_stats: dict[str, list[dict[str, Any]]] = {}
+        for statistic_id in statistic_ids:
+            last_stats.update(
+                get_last_statistics(self.hass, 1, statistic_id, True, {"sum", "state"})
+            )
+        return last_stats
+
+    async def _import_data_type_statistics(
         self,
         utility_type: str,
         data_type: str,
+        statistic_id: str,
+        hourly_data: list[tuple[datetime, float]],
+        last_stat: dict[str, Any] | None,
     ) -> None:
         """Import statistics for a single utility type and data type."""
-        hourly_data = self._cache.get_hourly_data_for_statistics(
-            utility_type=utility_type,
-            data_type=data_type,
-        )
-
-        if not hourly_data:
-            _LOGGER.info(
-                "No %s %s data to import to statistics", utility_type, data_type
-            )
-            return
-
-        # Create statistic ID (external statistics use domain:id format)
-        stat_suffix = "usage" if data_type == DATA_TYPE_USAGE else "cost"
-        statistic_id = f"{DOMAIN}:{utility_type.lower()}_{stat_suffix}"
-
         # Determine unit
-        if data_type == DATA_TYPE_USAGE:
-            if utility_type == UTILITY_TYPE_ELECTRIC:
-                unit = UnitOfEnergy.KILO_WATT_HOUR
-            else:
-                # Gas/Water - get unit from cache
-                records = self._cache.read_usage_data(
-                    utility_type=utility_type, data_type=data_type
-                )
-                unit = records[0]["unit_of_measure"] if records else "CCF"
-        else:
+        if data_type != DATA_TYPE_USAGE:
             unit = "USD"
+        elif utility_type == UTILITY_TYPE_ELECTRIC:
+            unit = UnitOfEnergy.KILO_WATT_HOUR
+        else:
+            # Gas/Water - get unit from cache
+            unit = self._cache.get_unit_of_measure(utility_type, data_type) or "CCF"
 
-        # Create metadata
-        metadata = StatisticMetaData(
-            has_mean=False,
-            has_sum=True,
-            name=f"{utility_type.capitalize()} {data_type.capitalize()}",
-            source=DOMAIN,
-            statistic_id=statistic_id,
-            unit_of_measurement=unit,
-        )
+        metadata = _statistic_metadata(statistic_id, utility_type, data_type, unit)
 
         # Determine if we should rebuild from scratch or continue from last stat
         last_stat_time = None
         last_stat_sum = 0.0
         last_stat_state = 0.0
-        
-        if not self._force_rebuild:
-            # Get the last known statistics to continue the cumulative sum
-            last_stats = await get_instance(self.hass).async_add_executor_job(
-                get_last_statistics, self.hass, 1, statistic_id, True, {"sum", "state"}
-            )
 
-            if last_stats and statistic_id in last_stats:
-                last_stat = last_stats[statistic_id][0]
-                last_stat_sum = last_stat.get("sum") or 0.0
-                last_stat_state = last_stat.get("state") or 0.0
-                last_stat_time = last_stat.get("start")
-                if last_stat_time:
-                    # Convert to datetime if it's a timestamp
-                    if isinstance(last_stat_time, (int, float)):
-                        from datetime import timezone
-                        last_stat_time = datetime.fromtimestamp(last_stat_time, tz=timezone.utc)
-                    _LOGGER.info(
-                        "Last %s %s stat: sum=%.2f state=%.2f at %s",
-                        utility_type,
-                        data_type,
-                        last_stat_sum,
-                        last_stat_state,
-                        last_stat_time,
-                    )
-                else:
-                    last_stat_time = None
-        
+        if last_stat:
+            last_stat_sum = last_stat.get("sum") or 0.0
+            last_stat_state = last_stat.get("state") or 0.0
+            last_stat_time = _statistic_start(last_stat)
+            if last_stat_time:
+                _LOGGER.info(
+                    "Last %s %s stat: sum=%.2f state=%.2f at %s",
+                    utility_type,
+                    data_type,
+                    last_stat_sum,
+                    last_stat_state,
+                    last_stat_time,
+                )
+
         if last_stat_time is None:
             _LOGGER.info(
                 "Building %s %s statistics from scratch (%d hourly records)",
@@ -331,36 +532,49 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
         # Start cumulative sum from the sum BEFORE the last recorded hour
         # (so we can re-import the last hour with updated data)
         cumulative_sum = last_stat_sum - last_stat_state if last_stat_time else 0.0
-        statistics: list[StatisticData] = []
-        
-        # Ensure last_stat_time is timezone-aware UTC for comparison
-        if last_stat_time and last_stat_time.tzinfo is None:
-            last_stat_time = last_stat_time.replace(tzinfo=timezone.utc)
-
-        for hourly in hourly_data:
-            hour_start = hourly["hour_start"]
-            # Skip hours that are BEFORE the last recorded stat (strictly less than)
-            # This allows us to re-import the last hour with updated values
-            if last_stat_time and hour_start < last_stat_time:
-                continue
-            cumulative_sum += hourly["value"]
-            statistics.append(
-                StatisticData(
-                    start=hour_start,
-                    sum=cumulative_sum,
-                    state=hourly["value"],
-                )
-            )
 
+        # Skip hours that are BEFORE the last recorded stat (strictly less than)
+        # This allows us to re-import the last hour with updated values.
+        # hourly_data is sorted by hour, so the cut-off is a binary search.
+        first_index = (
+            bisect_left(hourly_data, last_stat_time, key=itemgetter(0))
+            if last_stat_time
+            else 0
+        )
+        new_hours = hourly_data[first_index:]
+
+        # Running totals in one C-level pass: itemgetter pulls the values
+        # without a Python generator frame, and the seed is dropped up front
+        running_sums = accumulate(map(itemgetter(1), new_hours), initial=cumulative_sum)
+        next(running_sums)
+        statistics = [
+            StatisticData(
+                start=hour_start,
+                sum=running_sum,
+                state=value,
+            )
+            for (hour_start, value), running_sum in zip(new_hours, running_sums)
+        ]
         if statistics:
             _LOGGER.info(
                 "Importing %d hourly %s %s statistics (sum=%.2f)",
                 len(statistics),
                 utility_type,
                 data_type,
-                cumulative_sum,
+                statistics[-1]["sum"],
             )
-            async_add_external_statistics(self.hass, metadata, statistics)
+            # Hand statistics to the recorder in chunks and yield to the event
+            # loop between them so long backfills don't block it
+            for chunk_start in range(0, len(statistics), STATISTICS_IMPORT_CHUNK_SIZE):
+                async_add_external_statistics(
+                    self.hass,
+                    metadata,
+                    statistics[
+                        chunk_start : chunk_start + STATISTICS_IMPORT_CHUNK_SIZE
+                    ],
+                )
+                await asyncio.sleep(0)
+            self._last_imported[statistic_id] = statistics[-1]
         else:
             _LOGGER.info(
                 "No new %s %s statistics to import (all %d records already recorded)",
@@ -369,7 +583,7 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                 len(hourly_data),
             )
 
-    def _read_aggregated_data(self) -> dict[str, Any]:
+    def _read_aggregated_data(self, now: datetime) -> dict[str, Any]:
         """Read and aggregate data from cache.
 
         Note: The data source has a ~2 hour lag but reports at 15-minute intervals.
@@ -385,6 +599,7 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                 usage_agg = self._cache.get_aggregated_data(
                     utility_type=utility_type,
                     data_type=DATA_TYPE_USAGE,
+                    now=now,
                 )
                 utility_data["usage"] = usage_agg
             except Exception as err:
@@ -406,6 +621,7 @@ class EnergyDataCoordinator(DataUpdateCoordinator):
                 cost_agg = self._cache.get_aggregated_data(
                     utility_type=utility_type,
                     data_type=DATA_TYPE_COST,
+                    now=now,
                 )
                 # Override unit for cost
                 cost_agg["unit"] = "USD"
@@ -6,7 +6,16 @@ Historical data is stored directly in Home Assistant's statistics system.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import heapq
+import logging
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from time import time_ns
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -14,6 +23,284 @@ from zoneinfo import ZoneInfo
 # but encoded as if they were UTC. We need to interpret them correctly.
 HSV_TIMEZONE = ZoneInfo("America/Chicago")
 
+_LOGGER = logging.getLogger(__name__)
+
+SECONDS_PER_HOUR = 3600
+MS_PER_HOUR = SECONDS_PER_HOUR * 1000
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
+
+# Longest span of wall-clock hours assumed to contain at most one DST change
+UNIFORM_OFFSET_SPAN_HOURS = 30 * 24
+
+# How long samples are kept in memory before being evicted
+DEFAULT_RETENTION = timedelta(days=7)
+
+
+def _sum_by_hour(samples: Iterable[tuple[float, float]]) -> list[tuple[int, float]]:
+    """Sum time-ordered (epoch seconds, value) samples into (epoch hour, total) pairs.
+
+    Samples must be sorted by time so each hour forms a contiguous run;
+    this avoids a hash lookup per sample and a sort of the grouped result.
+    """
+    totals: list[tuple[int, float]] = []
+    current_hour: int | None = None
+    current_total = 0.0
+    for epoch_s, value in samples:
+        # Integer epoch-hour bucket: one division instead of a new datetime
+        hour_key = int(epoch_s) // SECONDS_PER_HOUR
+        if hour_key != current_hour:
+            if current_hour is not None:
+                totals.append((current_hour, current_total))
+            current_hour = hour_key
+            current_total = 0.0
+        current_total += value
+    if current_hour is not None:
+        totals.append((current_hour, current_total))
+    return totals
+
+
+def _intern(value: Any) -> Any:
+    """Return the interned copy of a string; other values pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=4096)
+def _central_to_utc_offset(wall_hour: int) -> int:
+    """Return the seconds to add to a Central wall-clock time to get UTC.
+
+    ``wall_hour`` is the wall-clock time in hours since the epoch, as if it
+    were UTC. DST changes on the hour, so one lookup covers every sample in
+    that hour instead of building datetimes per sample.
+    """
+    wall_time = datetime(1970, 1, 1) + timedelta(hours=wall_hour)
+    return -int(HSV_TIMEZONE.utcoffset(wall_time).total_seconds())
+
+
+def _to_samples(
+    points: list[tuple[int, float]],
+) -> list[tuple[int, float, float]]:
+    """Convert sorted (timestamp_ms, value) API points to cache samples.
+
+    The API returns timestamps as local Central Time, but encoded as if UTC.
+    Each sample is (timestamp_ms, actual UTC epoch seconds, value), shifting
+    the wall-clock time by its Central Time offset.
+    """
+    if not points:
+        return []
+    first_hour = points[0][0] // MS_PER_HOUR
+    last_hour = points[-1][0] // MS_PER_HOUR
+    offset_s = _central_to_utc_offset(first_hour)
+    # DST changes are months apart, so a span shorter than that with the
+    # same offset at both ends has no change inside it: one offset for all
+    if (
+        last_hour - first_hour < UNIFORM_OFFSET_SPAN_HOURS
+        and _central_to_utc_offset(last_hour) == offset_s
+    ):
+        return [
+            (timestamp_ms, timestamp_ms / 1000 + offset_s, value)
+            for timestamp_ms, value in points
+        ]
+
+    # Otherwise look the offset up again whenever the wall-clock hour changes
+    samples = []
+    offset_hour = first_hour
+    for timestamp_ms, value in points:
+        wall_hour = timestamp_ms // MS_PER_HOUR
+        if wall_hour != offset_hour:
+            offset_hour = wall_hour
+            offset_s = _central_to_utc_offset(wall_hour)
+        samples.append((timestamp_ms, timestamp_ms / 1000 + offset_s, value))
+    return samples
+
+
+def _epoch_ms(now: datetime | None) -> int:
+    """Return the given time, or the current time, in epoch milliseconds."""
+    if now is None:
+        return time_ns() // 1_000_000
+    return int(now.timestamp() * 1000)
+
+
+def _utc_midnight_s(day: date) -> float:
+    """Return the start of a UTC calendar day in epoch seconds."""
+    return datetime.combine(day, time(), tzinfo=timezone.utc).timestamp()
+
+
+@lru_cache(maxsize=16)
+def _isoformat_utc(epoch_s: float) -> str:
+    """Format epoch seconds as an ISO 8601 UTC timestamp.
+
+    The latest sample only changes every 15 minutes while the coordinator
+    asks for it on every update, so the formatted string is reused.
+    """
+    return datetime.fromtimestamp(epoch_s, tz=timezone.utc).isoformat()
+
+
+class _MeterSeries:
+    """Columnar storage for one meter's samples, sorted by timestamp.
+
+    Values live in typed arrays (8 bytes per sample) rather than a dict per
+    record; fields shared by the whole series are stored once.
+    """
+
+    __slots__ = (
+        "account_number",
+        "epoch_s",
+        "service_location_number",
+        "time_frame",
+        "timestamp_ms",
+        "unit_of_measure",
+        "usage_value",
+    )
+
+    def __init__(
+        self,
+        service_location_number: str,
+        account_number: str,
+        unit_of_measure: str,
+        time_frame: str,
+    ) -> None:
+        """Initialize an empty series."""
+        self.service_location_number = service_location_number
+        self.account_number = account_number
+        self.unit_of_measure = unit_of_measure
+        self.time_frame = time_frame
+        # Raw API timestamp (Central wall-clock time encoded as UTC)
+        self.timestamp_ms = array("q")
+        # Actual UTC time of the sample, in epoch seconds
+        self.epoch_s = array("d")
+        self.usage_value = array("d")
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.timestamp_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the series in a JSON-serializable form."""
+        return {
+            "service_location_number": self.service_location_number,
+            "account_number": self.account_number,
+            "unit_of_measure": self.unit_of_measure,
+            "time_frame": self.time_frame,
+            "timestamp_ms": self.timestamp_ms.tolist(),
+            "epoch_s": self.epoch_s.tolist(),
+            "usage_value": self.usage_value.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _MeterSeries:
+        """Rebuild a series from the output of as_dict."""
+        series = cls(
+            data["service_location_number"],
+            data["account_number"],
+            data["unit_of_measure"],
+            data["time_frame"],
+        )
+        series.timestamp_ms.extend(data["timestamp_ms"])
+        series.epoch_s.extend(data["epoch_s"])
+        series.usage_value.extend(data["usage_value"])
+        if (
+            not len(series.timestamp_ms)
+            == len(series.epoch_s)
+            == len(series.usage_value)
+        ):
+            raise ValueError("Cached series columns differ in length")
+        return series
+
+    def add_samples(self, samples: list[tuple[int, float, float]]) -> int:
+        """Add (timestamp_ms, epoch seconds, value) samples sorted by timestamp.
+
+        Samples whose timestamp is already cached are skipped. Fetches usually
+        only return samples newer than everything cached, which are appended
+        in place; otherwise the incoming run is merged with the cached tail it
+        overlaps, dropping duplicates as the two sorted runs are walked.
+
+        Returns:
+            Number of samples added
+        """
+        if not samples:
+            return 0
+        timestamps = self.timestamp_ms
+        start = bisect_left(timestamps, samples[0][0]) if timestamps else 0
+        if start < len(timestamps):
+            tail = zip(
+                timestamps[start:], self.epoch_s[start:], self.usage_value[start:]
+            )
+            merged: list[tuple[int, float, float]] = []
+            added = 0
+            cached = next(tail, None)
+            for sample in samples:
+                while cached is not None and cached[0] < sample[0]:
+                    merged.append(cached)
+                    cached = next(tail, None)
+                if cached is not None and cached[0] == sample[0]:
+                    continue
+                merged.append(sample)
+                added += 1
+            if not added:
+                # Everything was already cached (a repeat poll); leave the
+                # columns untouched rather than rewriting the same tail
+                return 0
+            if cached is not None:
+                merged.append(cached)
+                merged.extend(tail)
+            del timestamps[start:], self.epoch_s[start:], self.usage_value[start:]
+            samples = merged
+        else:
+            added = len(samples)
+        timestamps.extend(map(itemgetter(0), samples))
+        self.epoch_s.extend(map(itemgetter(1), samples))
+        self.usage_value.extend(map(itemgetter(2), samples))
+        return added
+
+    def drop_before(self, cutoff_ms: int) -> int:
+        """Drop samples with a timestamp before the cutoff; return how many."""
+        count = bisect_left(self.timestamp_ms, cutoff_ms)
+        if count:
+            del self.timestamp_ms[:count]
+            del self.epoch_s[:count]
+            del self.usage_value[:count]
+        return count
+
+    def samples(self) -> Iterable[tuple[float, float]]:
+        """Return (epoch seconds, value) pairs in time order."""
+        return zip(self.epoch_s, self.usage_value)
+
+    def iter_records(
+        self,
+        utility_type: str,
+        data_type: str,
+        meter_number: str,
+        start_s: float | None = None,
+        end_s: float | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the series as record dicts, in timestamp order.
+
+        Only samples in [start_s, end_s) (epoch seconds) are yielded when
+        bounds are given; the bounds are found by binary search. The UTC
+        date and hour are not stored; derive them from datetime_utc.
+        """
+        lo = bisect_left(self.epoch_s, start_s) if start_s is not None else 0
+        hi = (
+            bisect_left(self.epoch_s, end_s, lo)
+            if end_s is not None
+            else len(self.epoch_s)
+        )
+        for timestamp_ms, epoch_s, usage_value in zip(
+            self.timestamp_ms[lo:hi], self.epoch_s[lo:hi], self.usage_value[lo:hi]
+        ):
+            yield {
+                "timestamp_ms": timestamp_ms,
+                "datetime_utc": datetime.fromtimestamp(epoch_s, tz=timezone.utc),
+                "usage_value": usage_value,
+                "unit_of_measure": self.unit_of_measure,
+                "utility_type": utility_type,
+                "data_type": data_type,
+                "meter_number": meter_number,
+                "service_location_number": self.service_location_number,
+                "account_number": self.account_number,
+                "time_frame": self.time_frame,
+            }
+
 
 class EnergyDataCache:
     """In-memory cache for recent energy usage data.
@@ -22,16 +309,23 @@ class EnergyDataCache:
     Historical data is stored directly in HA's statistics system.
     """
 
-    def __init__(self, base_path: str = "./energy_data") -> None:
+    def __init__(
+        self,
+        base_path: str = "./energy_data",
+        retention: timedelta = DEFAULT_RETENTION,
+    ) -> None:
         """Initialize the data cache.
 
         Args:
             base_path: Ignored, kept for API compatibility with old code.
+            retention: How long samples are kept in memory.
         """
-        # Structure: {utility_type: {data_type: {meter_number: [records]}}}
-        self._data: dict[str, dict[str, dict[str, list[dict]]]] = {}
-        # Track last fetch timestamps per utility/meter
-        self._last_fetch: dict[str, datetime] = {}
+        self._retention_ms = int(retention.total_seconds() * 1000)
+        # Structure: {(utility_type, data_type, meter_number): series}
+        self._series: dict[tuple[str, str, str], _MeterSeries] = {}
+        # Track last fetch timestamps (epoch milliseconds) per
+        # (utility_type, data_type)
+        self._last_fetch: dict[tuple[str, str], int] = {}
 
     def save_usage_data(
         self,
@@ -43,6 +337,7 @@ class EnergyDataCache:
         unit_of_measure: str,
         time_frame: str = "HOURLY",
         data_type: str = "USAGE",
+        now: datetime | None = None,
     ) -> int:
         """
         Save utility usage data to in-memory cache.
@@ -56,80 +351,94 @@ class EnergyDataCache:
             unit_of_measure: Unit of measurement (KWH, CCF, GAL, etc.)
             time_frame: Time frame of the data (HOURLY, DAILY, etc.)
             data_type: Type of data (USAGE or COST)
+            now: Current UTC time, to share one clock reading across calls
 
         Returns:
-            Number of records saved
+            Number of new records saved within the retention window
         """
         if not data:
             return 0
 
-        # Ensure nested structure exists
-        if utility_type not in self._data:
-            self._data[utility_type] = {}
-        if data_type not in self._data[utility_type]:
-            self._data[utility_type][data_type] = {}
-        if meter_number not in self._data[utility_type][data_type]:
-            self._data[utility_type][data_type][meter_number] = []
-
-        # Convert API data to record format
-        records = []
-        for point in data:
-            timestamp_ms = point["x"]
-            usage_value = point["y"]
-
-            # The API returns timestamps as local Central Time, but encoded as if UTC.
-            # We interpret the timestamp as UTC first, then treat that wall-clock time
-            # as Central Time and convert to actual UTC.
-            naive_dt = datetime.utcfromtimestamp(timestamp_ms / 1000)
-            # Treat this naive datetime as Central Time
-            local_dt = naive_dt.replace(tzinfo=HSV_TIMEZONE)
-            # Convert to proper UTC
-            dt = local_dt.astimezone(timezone.utc)
-
-            records.append(
-                {
-                    "timestamp_ms": timestamp_ms,
-                    "datetime_utc": dt,
-                    "date": dt.date(),
-                    "hour": dt.hour if time_frame == "HOURLY" else None,
-                    "usage_value": usage_value,
-                    "unit_of_measure": unit_of_measure,
-                    "utility_type": utility_type,
-                    "data_type": data_type,
-                    "meter_number": meter_number,
-                    "service_location_number": service_location_number,
-                    "account_number": account_number,
-                    "time_frame": time_frame,
-                }
+        now_ms = _epoch_ms(now)
+
+        # Every fetch decodes fresh copies of these strings, and a meter's
+        # usage and cost series repeat them; interning keeps one copy each
+        meter_number = _intern(meter_number)
+        service_location_number = _intern(service_location_number)
+        account_number = _intern(account_number)
+        unit_of_measure = _intern(unit_of_measure)
+
+        key = (utility_type, data_type, meter_number)
+        series = self._series.get(key)
+
+        # Sort the raw (timestamp_ms, value) points and cut those already
+        # outside the retention window (a full fetch_days backfill reaches
+        # well past it) before converting them; timestamps already cached
+        # are dropped when the rest are merged in
+        points = sorted(map(itemgetter("x", "y"), data), key=itemgetter(0))
+        cutoff_ms = now_ms - self._retention_ms
+        del points[: bisect_left(points, cutoff_ms, key=itemgetter(0))]
+        new_samples = _to_samples(points)
+
+        if series is None:
+            series = self._series[key] = _MeterSeries(
+                service_location_number, account_number, unit_of_measure, time_frame
             )
+        else:
+            # Series-wide fields follow the latest response
+            series.service_location_number = service_location_number
+            series.account_number = account_number
+            series.unit_of_measure = unit_of_measure
+            series.time_frame = time_frame
+        new_count = series.add_samples(new_samples)
+        series.drop_before(cutoff_ms)
 
-        # Get existing records
-        existing = self._data[utility_type][data_type][meter_number]
-
-        # Create a set of existing timestamps for deduplication
-        existing_timestamps = {r["timestamp_ms"] for r in existing}
+        # Update last fetch timestamp
+        self._last_fetch[(utility_type, data_type)] = now_ms
+
+        return new_count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cached samples in a JSON-serializable form."""
+        # Stored nested as {utility_type: {data_type: {meter_number: series}}}
+        data: dict[str, Any] = {}
+        for (utility_type, data_type, meter_number), series in self._series.items():
+            data.setdefault(utility_type, {}).setdefault(data_type, {})[
+                meter_number
+            ] = series.as_dict()
+        return data
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        """Replace the cached samples with the output of as_dict.
+
+        Raises:
+            KeyError, TypeError, ValueError: If the data is malformed; the
+                cache is left unchanged.
+        """
+        self._series = {
+            (utility_type, data_type, meter_number): _MeterSeries.from_dict(series)
+            for utility_type, data_types in data.items()
+            for data_type, meters in data_types.items()
+            for meter_number, series in meters.items()
+        }
 
-        # Add only new records
-        new_records = [
-            r for r in records if r["timestamp_ms"] not in existing_timestamps
-        ]
-        existing.extend(new_records)
+    def evict_expired(self, now: datetime | None = None) -> int:
+        """Drop samples older than the retention window from every series.
 
-        # Sort by timestamp
-        existing.sort(key=lambda x: x["timestamp_ms"])
+        Series only trim themselves when new data is saved, so this also
+        covers meters that have stopped reporting; emptied series are removed.
 
-        # Keep only last 7 days of data in memory to prevent unbounded growth
-        seven_days_ago_ms = int(
-            (datetime.now(tz=timezone.utc).timestamp() - 7 * 24 * 3600) * 1000
-        )
-        self._data[utility_type][data_type][meter_number] = [
-            r for r in existing if r["timestamp_ms"] >= seven_days_ago_ms
-        ]
-
-        # Update last fetch timestamp
-        self._last_fetch[f"{utility_type}_{data_type}"] = datetime.now(tz=timezone.utc)
+        Returns:
+            Number of samples evicted
+        """
+        cutoff_ms = _epoch_ms(now) - self._retention_ms
 
-        return len(new_records)
+        evicted = 0
+        for key, series in list(self._series.items()):
+            evicted += series.drop_before(cutoff_ms)
+            if not series:
+                del self._series[key]
+        return evicted
 
     def read_usage_data(
         self,
@@ -152,70 +461,111 @@ class EnergyDataCache:
         Returns:
             List of usage records matching filters
         """
-        results = []
-
-        # Determine which utility types to query
-        utility_types = [utility_type] if utility_type else list(self._data.keys())
-
-        for ut in utility_types:
-            if ut not in self._data:
-                continue
-
-            # Determine which data types to query
-            data_types = [data_type] if data_type else list(self._data[ut].keys())
-
-            for dt in data_types:
-                if dt not in self._data[ut]:
-                    continue
-
-                # Determine which meters to query
-                meters = (
-                    [meter_number] if meter_number else list(self._data[ut][dt].keys())
-                )
-
-                for meter in meters:
-                    if meter not in self._data[ut][dt]:
-                        continue
+        # Date filters as epoch-second bounds on the (UTC) record date: from
+        # the start of start_date up to the start of the day after end_date
+        start_s = (
+            _utc_midnight_s(datetime.fromisoformat(start_date).date())
+            if start_date
+            else None
+        )
+        end_s = (
+            _utc_midnight_s(datetime.fromisoformat(end_date).date() + timedelta(days=1))
+            if end_date
+            else None
+        )
 
-                    records = self._data[ut][dt][meter]
+        return list(
+            self._iter_records(utility_type, data_type, meter_number, start_s, end_s)
+        )
 
-                    # Apply date filters
-                    for record in records:
-                        record_date = record["date"]
+    def _iter_records(
+        self,
+        utility_type: str | None,
+        data_type: str | None,
+        meter_number: str | None,
+        start_s: float | None,
+        end_s: float | None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield records matching the filters, in timestamp order.
+
+        Records are built lazily, so a consumer can aggregate them in one
+        streaming pass without the full result being materialized.
+        """
+        # A fully specified meter is a single lookup
+        if utility_type and data_type and meter_number:
+            series = self._series.get((utility_type, data_type, meter_number))
+            if series is None:
+                return iter(())
+            return series.iter_records(
+                utility_type, data_type, meter_number, start_s=start_s, end_s=end_s
+            )
 
-                        if start_date:
-                            start_d = datetime.fromisoformat(start_date).date()
-                            if record_date < start_d:
-                                continue
+        # Each series yields its records sorted by timestamp
+        per_series = [
+            series.iter_records(ut, dt, meter, start_s=start_s, end_s=end_s)
+            for (ut, dt, meter), series in self._series.items()
+            if not (
+                (utility_type and ut != utility_type)
+                or (data_type and dt != data_type)
+                or (meter_number and meter != meter_number)
+            )
+        ]
+        if len(per_series) == 1:
+            return per_series[0]
+
+        # Merge the sorted runs by datetime rather than re-sorting them
+        return heapq.merge(*per_series, key=itemgetter("timestamp_ms"))
+
+    def _meter_series(self, utility_type: str, data_type: str) -> list[_MeterSeries]:
+        """Return the non-empty per-meter series for a utility and data type."""
+        return [
+            series
+            for (ut, dt, _), series in self._series.items()
+            if ut == utility_type and dt == data_type and series
+        ]
 
-                        if end_date:
-                            end_d = datetime.fromisoformat(end_date).date()
-                            if record_date > end_d:
-                                continue
+    def get_unit_of_measure(self, utility_type: str, data_type: str) -> str | None:
+        """Return the cached unit of measure for a utility and data type."""
+        meter_series = self._meter_series(utility_type, data_type)
+        return meter_series[0].unit_of_measure if meter_series else None
 
-                        results.append(record)
+    def get_latest_time(self, utility_type: str) -> datetime | None:
+        """Return the time up to which every cached data type of a utility has data.
 
-        # Sort by datetime
-        results.sort(key=lambda x: x["timestamp_ms"])
-        return results
+        This is the earliest of the per-data-type latest samples, or None if
+        nothing is cached for the utility.
+        """
+        latest_by_type: dict[str, float] = {}
+        for (ut, dt, _), series in self._series.items():
+            if ut == utility_type and series:
+                latest = series.epoch_s[-1]
+                latest_by_type[dt] = max(latest, latest_by_type.get(dt, latest))
+        if not latest_by_type:
+            return None
+        return datetime.fromtimestamp(min(latest_by_type.values()), tz=timezone.utc)
 
     def get_aggregated_data(
         self,
         utility_type: str,
         data_type: str,
+        now: datetime | None = None,
     ) -> dict[str, Any]:
         """
         Get aggregated usage data for a utility type.
 
-        Returns dict with today, yesterday, last_24h totals and metadata.
+        Returns dict with today, yesterday, last_24h totals and metadata,
+        relative to ``now`` (the current UTC time when omitted).
         """
-        now = datetime.now(tz=timezone.utc)
-        today = now.date()
-        yesterday = today - timedelta(days=1)
+        # UTC day boundaries as epoch seconds, to compare against the time
+        # column; UTC days are a fixed length, so no datetimes are needed
+        now_s = time_ns() / 1e9 if now is None else now.timestamp()
+        today_start_s = now_s - now_s % SECONDS_PER_DAY
+        yesterday_start_s = today_start_s - SECONDS_PER_DAY
+        tomorrow_start_s = today_start_s + SECONDS_PER_DAY
 
-        records = self.read_usage_data(utility_type=utility_type, data_type=data_type)
+        meter_series = self._meter_series(utility_type, data_type)
 
-        if not records:
+        if not meter_series:
             return {
                 "last_24h": 0.0,
                 "today": 0.0,
@@ -225,35 +575,37 @@ class EnergyDataCache:
                 "data_lag_hours": None,
             }
 
-        # Calculate totals
-        today_total = sum(r["usage_value"] for r in records if r["date"] == today)
-        yesterday_total = sum(
-            r["usage_value"] for r in records if r["date"] == yesterday
-        )
-
-        # Get most recent record
-        latest = records[-1] if records else None
-        latest_dt = latest["datetime_utc"] if latest else None
-
-        # Calculate last 24 hours from most recent data point
+        # Get most recent sample, and the series holding the earliest one
+        latest_series = max(meter_series, key=lambda series: series.timestamp_ms[-1])
+        earliest_series = min(meter_series, key=lambda series: series.timestamp_ms[0])
+        latest_s = latest_series.epoch_s[-1]
+
+        # Calculate the daily totals and the last 24 hours from the most
+        # recent data point. Each series is sorted by time, so every window
+        # is a binary-searched slice summed in C rather than a per-sample test.
+        cutoff_s = latest_s - 24 * SECONDS_PER_HOUR
+        today_total = 0.0
+        yesterday_total = 0.0
         last_24h_total = 0.0
-        if latest_dt:
-            cutoff = latest_dt - timedelta(hours=24)
-            last_24h_total = sum(
-                r["usage_value"] for r in records if r["datetime_utc"] > cutoff
-            )
+        for series in meter_series:
+            epochs, values = series.epoch_s, series.usage_value
+            yesterday_i = bisect_left(epochs, yesterday_start_s)
+            today_i = bisect_left(epochs, today_start_s, yesterday_i)
+            tomorrow_i = bisect_left(epochs, tomorrow_start_s, today_i)
+            yesterday_total += sum(values[yesterday_i:today_i])
+            today_total += sum(values[today_i:tomorrow_i])
+            last_24h_total += sum(values[bisect_right(epochs, cutoff_s) :])
 
         # Calculate data lag
-        data_lag_hours = None
-        if latest_dt:
-            data_lag_hours = round((now - latest_dt).total_seconds() / 3600, 1)
+        data_lag_hours = round((now_s - latest_s) / 3600, 1)
 
         return {
-            "last_24h": round(last_24h_total, 2),
+            # The sensor state; rounded for display by the sensor entity
+            "last_24h": last_24h_total,
             "today": round(today_total, 2),
             "yesterday": round(yesterday_total, 2),
-            "unit": records[0]["unit_of_measure"] if records else "UNKNOWN",
-            "last_update": latest_dt.isoformat() if latest_dt else None,
+            "unit": earliest_series.unit_of_measure,
+            "last_update": _isoformat_utc(latest_s),
             "data_lag_hours": data_lag_hours,
         }
 
@@ -261,60 +613,69 @@ class EnergyDataCache:
         self,
         utility_type: str,
         data_type: str,
-    ) -> list[dict[str, Any]]:
+    ) -> list[tuple[datetime, float]]:
         """
         Get hourly aggregated data suitable for HA statistics import.
 
-        Returns list of dicts with 'hour_start' (datetime) and 'value' (float).
+        Returns list of (hour_start, value) tuples sorted by hour_start, where
+        hour_start is a timezone-aware UTC datetime.
         """
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        
-        records = self.read_usage_data(utility_type=utility_type, data_type=data_type)
+        # Aggregate straight from the per-meter columns (each already sorted
+        # by timestamp) rather than materializing records via read_usage_data
+        meter_series = self._meter_series(utility_type, data_type)
 
-        if not records:
+        if not meter_series:
             _LOGGER.info("No records in cache for %s %s", utility_type, data_type)
             return []
 
         # Log the time range of data in cache
-        first_record = records[0]
-        last_record = records[-1]
         _LOGGER.info(
             "Cache has %d %s %s records from %s to %s",
-            len(records),
+            sum(len(series) for series in meter_series),
             utility_type,
             data_type,
-            first_record["datetime_utc"],
-            last_record["datetime_utc"],
+            datetime.fromtimestamp(
+                min(series.epoch_s[0] for series in meter_series), tz=timezone.utc
+            ),
+            datetime.fromtimestamp(
+                max(series.epoch_s[-1] for series in meter_series), tz=timezone.utc
+            ),
         )
 
-        # Group by hour
+        # Sum each meter's (sorted) samples by hour, then add the meters
+        # together in a list indexed by hour offset, which also leaves the
+        # totals in hour order without a merge or sort
+        base_hour = (
+            int(min(series.epoch_s[0] for series in meter_series)) // SECONDS_PER_HOUR
+        )
+        last_hour = (
+            int(max(series.epoch_s[-1] for series in meter_series)) // SECONDS_PER_HOUR
+        )
+        totals: list[float | None] = [None] * (last_hour - base_hour + 1)
+        for series in meter_series:
+            for hour_key, value in _sum_by_hour(series.samples()):
+                offset = hour_key - base_hour
+                total = totals[offset]
+                totals[offset] = value if total is None else total + value
+
         # HA expects timezone-aware UTC datetimes for external statistics
-        hourly: dict[datetime, float] = {}
-        for record in records:
-            dt = record["datetime_utc"]
-            # Keep timezone-aware UTC datetime
-            hour_start = dt.replace(minute=0, second=0, microsecond=0)
-            if hour_start not in hourly:
-                hourly[hour_start] = 0.0
-            hourly[hour_start] += record["usage_value"]
-
-        # Convert to list sorted by time
         result = [
-            {"hour_start": hour, "value": value}
-            for hour, value in sorted(hourly.items())
+            (
+                datetime.fromtimestamp(
+                    (base_hour + offset) * SECONDS_PER_HOUR, tz=timezone.utc
+                ),
+                total,
+            )
+            for offset, total in enumerate(totals)
+            if total is not None
         ]
-        
+
         if result:
             _LOGGER.info(
                 "Hourly aggregation: %d hours from %s to %s",
                 len(result),
-                result[0]["hour_start"],
-                result[-1]["hour_start"],
+                result[0][0],
+                result[-1][0],
             )
 
         return result
-
-
-# Backwards compatibility alias
-EnergyDeltaStorage = EnergyDataCache
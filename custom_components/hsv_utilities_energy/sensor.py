@@ -11,7 +11,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -21,6 +21,28 @@ from .coordinator import EnergyDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# API unit strings that differ from HA's expected casing
+_UNIT_NORMALIZATION = {"KWH": "kWh", "WH": "Wh"}
+
+# Usage sensor (icon, device class) per utility type
+_USAGE_CONFIG: dict[str, tuple[str, SensorDeviceClass | None]] = {
+    "ELECTRIC": ("mdi:flash", SensorDeviceClass.ENERGY),
+    # Home Assistant does not accept 'CCF' for SensorDeviceClass.GAS.
+    # Avoid setting a device class to prevent unit validation errors.
+    "GAS": ("mdi:fire", None),
+    "WATER": ("mdi:water", SensorDeviceClass.WATER),
+}
+_DEFAULT_USAGE_CONFIG: tuple[str, SensorDeviceClass | None] = ("mdi:gauge", None)
+
+
+def _device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return device information shared by an entry's sensors."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="HSV Utilities Energy",
+        configuration_url="https://hsvutil.smarthub.coop",
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -77,32 +99,18 @@ class EnergyUsageSensor(CoordinatorEntity[EnergyDataCoordinator], SensorEntity):
         utility_name = utility_type.capitalize()
         self._attr_name = f"{utility_name} Usage"
 
-        # Set icon based on utility type
-        if utility_type == "ELECTRIC":
-            self._attr_icon = "mdi:flash"
-            self._attr_device_class = SensorDeviceClass.ENERGY
-        elif utility_type == "GAS":
-            self._attr_icon = "mdi:fire"
-            # Home Assistant does not accept 'CCF' for SensorDeviceClass.GAS.
-            # Avoid setting a device class to prevent unit validation errors.
-            self._attr_device_class = None
-        elif utility_type == "WATER":
-            self._attr_icon = "mdi:water"
-            self._attr_device_class = SensorDeviceClass.WATER
-        else:
-            self._attr_icon = "mdi:gauge"
+        # Set icon and device class based on utility type
+        self._attr_icon, self._attr_device_class = _USAGE_CONFIG.get(
+            utility_type, _DEFAULT_USAGE_CONFIG
+        )
 
         # State class for energy dashboard
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="HSV Utilities Energy",
-            configuration_url="https://hsvutil.smarthub.coop",
-        )
+        self._attr_suggested_display_precision = 2
+        self._attr_device_info = _device_info(entry)
+        # The unit only changes with new coordinator data, so it is resolved
+        # once per update instead of on every state write
+        self._attr_native_unit_of_measurement = self._resolve_unit()
 
     @property
     def native_value(self) -> float | None:
@@ -115,9 +123,8 @@ class EnergyUsageSensor(CoordinatorEntity[EnergyDataCoordinator], SensorEntity):
         # Show last 24h of available data (accounts for ~2hr data lag)
         return usage_data.get("last_24h", 0.0)
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
+    def _resolve_unit(self) -> str | None:
+        """Return the unit of measurement from the coordinator data."""
         if not self.coordinator.data:
             return None
 
@@ -125,11 +132,13 @@ class EnergyUsageSensor(CoordinatorEntity[EnergyDataCoordinator], SensorEntity):
         usage_data = utility_data.get("usage", {})
         unit = usage_data.get("unit")
         # Normalize units to HA expected casing
-        if unit == "KWH":
-            return "kWh"
-        if unit == "WH":
-            return "Wh"
-        return unit
+        return _UNIT_NORMALIZATION.get(unit, unit)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the unit of measurement before writing the new state."""
+        self._attr_native_unit_of_measurement = self._resolve_unit()
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -185,15 +194,8 @@ class EnergyCostSensor(CoordinatorEntity[EnergyDataCoordinator], SensorEntity):
         # Monetary sensors should use 'total' not 'total_increasing'
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_native_unit_of_measurement = "USD"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="HSV Utilities Energy",
-            configuration_url="https://hsvutil.smarthub.coop",
-        )
+        self._attr_suggested_display_precision = 2
+        self._attr_device_info = _device_info(entry)
 
     @property
     def native_value(self) -> float | None:
@@ -1,28 +1,273 @@
 """Delta Lake storage module for energy usage data."""
 
+import json
+import operator
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from functools import reduce
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from deltalake import DeltaTable, write_deltalake
 
 
+def _constant_column(n: int, value: str) -> pd.Categorical:
+    """Return an n-row column holding one value, stored as a single category."""
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), [value])
+
+
+def _sql_literal(value: object) -> str:
+    """Return a value as a quoted SQL string literal for a merge predicate."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_list(column: pd.Series) -> str:
+    """Return a column's distinct values as a SQL IN list of literals."""
+    return ", ".join(_sql_literal(value) for value in sorted(set(column)))
+
+
+# Reads reuse a usage table snapshot refreshed this recently (seconds)
+_READ_REFRESH_INTERVAL = 5.0
+
+# Target size of files written by optimize_table()
+_TARGET_FILE_SIZE = 256 * 1024 * 1024
+
+_MS_PER_HOUR = 3_600_000
+_MS_PER_DAY = 86_400_000
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _utc_dates(timestamp_ms: np.ndarray) -> np.ndarray:
+    """
+    Return the UTC calendar date of each millisecond timestamp.
+
+    The day numbers are found with one integer pass over the array, and a
+    date object is built once per distinct day rather than once per row.
+    """
+    days, inverse = np.unique(timestamp_ms // _MS_PER_DAY, return_inverse=True)
+    dates = np.array(
+        [date.fromordinal(_EPOCH_ORDINAL + int(day)) for day in days], dtype=object
+    )
+    return dates[inverse]
+
+
+# Millisecond timestamps, derived from datetime_utc as they are no longer
+# stored; a usage table's only time column is datetime_utc
+_TIMESTAMP_MS = (
+    pc.field("datetime_utc").cast(pa.timestamp("ms", tz="UTC")).cast(pa.int64())
+)
+
+
+def _usage_projection(
+    schema: pa.Schema, columns: Optional[list[str]] = None
+) -> dict[str, pc.Expression]:
+    """Return a scan projection of usage columns, timestamp_ms included."""
+    if columns is None:
+        columns = ["timestamp_ms"] + [
+            name for name in schema.names if name != "timestamp_ms"
+        ]
+    return {
+        name: _TIMESTAMP_MS if name == "timestamp_ms" else pc.field(name)
+        for name in columns
+    }
+
+
+def _usage_frame(
+    xs: Sequence[int], ys: Sequence[float], identifiers: dict[str, Any]
+) -> pd.DataFrame:
+    """
+    Return a frame of usage rows from API point values and identifiers.
+
+    The frame is built column by column, so the timestamps are converted
+    in one vectorized call rather than per point.
+    """
+    timestamp_ms = np.array(xs, dtype=np.int64)
+    return pd.DataFrame(
+        {
+            "timestamp_ms": timestamp_ms,
+            "datetime_utc": pd.to_datetime(timestamp_ms, unit="ms", utc=True),
+            # Only the partition column is stored; the other date parts are
+            # derived from datetime_utc on read
+            "date": _utc_dates(timestamp_ms),
+            "usage_value": np.array(ys, dtype=np.float64),
+            **identifiers,
+        }
+    )
+
+
+def _distinct_pairs(table: pa.Table, first: str, second: str) -> set[tuple]:
+    """Return the distinct value pairs of two columns of an Arrow table."""
+    pairs = table.group_by([first, second], use_threads=False).aggregate([])
+    return set(zip(pairs[first].to_pylist(), pairs[second].to_pylist()))
+
+
+def _with_date_parts(df: pd.DataFrame) -> pd.DataFrame:
+    """Add year, month, day and hour columns derived from datetime_utc."""
+    if df.empty:
+        return df
+    dt = df["datetime_utc"].dt
+    return df.assign(
+        year=dt.year,
+        month=dt.month,
+        day=dt.day,
+        # Only hourly data carries a meaningful hour
+        hour=dt.hour.where(df["time_frame"] == "HOURLY"),
+    )
+
+
 class EnergyDeltaStorage:
     """Delta Lake storage handler for energy usage data."""
 
-    def __init__(self, base_path: str = "./energy_data"):
+    def __init__(
+        self, base_path: str = "./energy_data", max_pending_rows: int = 100_000
+    ):
         """
         Initialize Delta Lake storage.
 
         Args:
             base_path: Base directory for Delta tables
+            max_pending_rows: Buffered usage rows that trigger an early flush
+                inside a batch()
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
 
         # Single unified usage table for all utilities
-        self.usage_path = str(self.base_path / "usage")
+        self.usage_dir = self.base_path / "usage"
+        self.usage_path = str(self.usage_dir)
         self.metadata_path = str(self.base_path / "fetch_metadata")
+        # Fetch metadata rows are appended here as JSON lines, and moved into
+        # the metadata table by compact_metadata()
+        self.metadata_log_path = Path(self.metadata_path + ".log")
+
+        # Tables are opened on first use and then refreshed incrementally
+        self._usage_dt: Optional[DeltaTable] = None
+        self._metadata_dt: Optional[DeltaTable] = None
+        self._usage_refreshed_at = 0.0
+        # Arrow schema of the usage table, fetched once for merge sources
+        self._usage_schema: Optional[pa.Schema] = None
+
+        # Writes buffered while inside batch(), committed together by flush()
+        self.max_pending_rows = max_pending_rows
+        self._batch_depth = 0
+        self._pending_usage: list[pd.DataFrame] = []
+        self._pending_usage_rows = 0
+        # Single-point saves, as (x, y, identifiers), not yet made a frame
+        self._pending_points: list[tuple[int, float, dict[str, str]]] = []
+        # Whether every buffered save was made with append_only=True
+        self._pending_append_only = True
+        self._pending_metadata: list[dict] = []
+
+    def _usage_table(self, max_age: float = 0.0) -> DeltaTable:
+        """
+        Return the usage table, opened once and kept up to date.
+
+        Args:
+            max_age: Seconds a snapshot may go without checking the log for
+                new commits; reads pass a few seconds so rapid reads skip
+                the check, writes always refresh
+        """
+        now = time.monotonic()
+        if self._usage_dt is None:
+            self._usage_dt = DeltaTable(self.usage_path)
+        elif now - self._usage_refreshed_at >= max_age:
+            # Only commits made since the last call are read from the log
+            self._usage_dt.update_incremental()
+        else:
+            return self._usage_dt
+        self._usage_refreshed_at = now
+        return self._usage_dt
+
+    def _metadata_table(self) -> DeltaTable:
+        """Return the fetch metadata table, opened once and kept up to date."""
+        if self._metadata_dt is None:
+            self._metadata_dt = DeltaTable(self.metadata_path)
+        else:
+            self._metadata_dt.update_incremental()
+        return self._metadata_dt
+
+    @contextmanager
+    def batch(self) -> Iterator["EnergyDeltaStorage"]:
+        """
+        Buffer saves made inside the block and commit them together.
+
+        Each save otherwise commits its own Delta transaction (and small
+        files); inside a batch, usage rows are merged in one transaction and
+        fetch metadata logged in one append when the block exits, or earlier
+        once max_pending_rows usage rows are buffered. Batches may nest.
+
+        If the block raises, the saves still buffered are discarded rather
+        than committed, and the exception propagates.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._discard_pending()
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
+    def _collect_pending_points(self):
+        """Move buffered single points into one pending usage frame."""
+        if not self._pending_points:
+            return
+        xs, ys, identifiers = zip(*self._pending_points)
+        self._pending_points = []
+        self._pending_usage.append(
+            _usage_frame(
+                xs,
+                ys,
+                {
+                    name: [point[name] for point in identifiers]
+                    if name in ("utility_type", "data_type")
+                    else pd.Categorical([point[name] for point in identifiers])
+                    for name in identifiers[0]
+                },
+            )
+        )
+
+    def _discard_pending(self):
+        """Drop buffered usage rows and fetch metadata without committing."""
+        self._pending_usage = []
+        self._pending_usage_rows = 0
+        self._pending_points = []
+        self._pending_append_only = True
+        self._pending_metadata = []
+
+    def flush(self):
+        """Commit any buffered usage rows and fetch metadata."""
+        self._collect_pending_points()
+        if self._pending_usage:
+            df = pd.concat(self._pending_usage, ignore_index=True)
+            self._pending_usage = []
+            self._pending_usage_rows = 0
+            append_only = self._pending_append_only
+            self._pending_append_only = True
+            # A key saved more than once in the batch keeps its latest row,
+            # as consecutive merges would have
+            df = df.drop_duplicates(
+                subset=["timestamp_ms", "meter_number", "utility_type", "data_type"],
+                keep="last",
+                ignore_index=True,
+            )
+            self._merge_usage(df, append_only)
+
+        if self._pending_metadata:
+            lines = "".join(json.dumps(row) + "\n" for row in self._pending_metadata)
+            self._pending_metadata = []
+            with self.metadata_log_path.open("a") as log:
+                log.write(lines)
 
     def save_usage_data(
         self,
@@ -34,6 +279,7 @@ class EnergyDeltaStorage:
         unit_of_measure: str,
         time_frame: str = "HOURLY",
         data_type: str = "USAGE",
+        append_only: bool = False,
     ) -> int:
         """
         Save utility usage data to Delta Lake (electricity, gas, water).
@@ -47,6 +293,8 @@ class EnergyDeltaStorage:
             unit_of_measure: Unit of measurement (KWH, CCF, GAL, etc.)
             time_frame: Time frame of the data (HOURLY, DAILY, etc.)
             data_type: Type of data (USAGE or COST)
+            append_only: The points are known not to be stored yet, so they
+                are appended without checking for existing rows
 
         Returns:
             Number of records written
@@ -54,67 +302,210 @@ class EnergyDeltaStorage:
         if not data:
             return 0
 
-        # Convert API data to pandas DataFrame
-        records = []
-        for point in data:
-            timestamp_ms = point["x"]
-            usage_value = point["y"]
+        identifiers = {
+            "unit_of_measure": unit_of_measure,
+            "utility_type": utility_type,
+            "data_type": data_type,
+            "meter_number": meter_number,
+            "service_location_number": service_location_number,
+            "account_number": account_number,
+            "time_frame": time_frame,
+        }
+
+        # A lone point (a polling scheduler's latest reading) is only
+        # buffered here; flush() builds one frame for all such points
+        if len(data) == 1 and self._batch_depth:
+            point = data[0]
+            self._pending_points.append((point["x"], point["y"], identifiers))
+            self._pending_usage_rows += 1
+            self._pending_append_only = self._pending_append_only and append_only
+            if self._pending_usage_rows >= self.max_pending_rows:
+                self.flush()
+            return 1
+
+        # One C-level itemgetter pass splits the points into x and y columns
+        xs, ys = zip(*map(operator.itemgetter("x", "y"), data))
+        # Identifiers are constant for a call, so each is stored once as a
+        # single category; the partition columns (utility_type, data_type)
+        # must stay plain strings for the writer
+        df = _usage_frame(
+            xs,
+            ys,
+            {
+                name: value
+                if name in ("utility_type", "data_type")
+                else _constant_column(len(data), value)
+                for name, value in identifiers.items()
+            },
+        )
 
-            # Convert milliseconds to datetime
-            dt = pd.to_datetime(timestamp_ms, unit="ms", utc=True)
+        self._save_frame(df, append_only)
+        return len(df)
 
-            records.append(
-                {
-                    "timestamp_ms": timestamp_ms,
-                    "datetime_utc": dt,
-                    "date": dt.date(),
-                    "year": dt.year,
-                    "month": dt.month,
-                    "day": dt.day,
-                    "hour": dt.hour if time_frame == "HOURLY" else None,
-                    "usage_value": usage_value,
-                    "unit_of_measure": unit_of_measure,
-                    "utility_type": utility_type,
-                    "data_type": data_type,
-                    "meter_number": meter_number,
-                    "service_location_number": service_location_number,
-                    "account_number": account_number,
-                    "time_frame": time_frame,
-                    "ingested_at": pd.Timestamp.now(tz="UTC"),
-                }
-            )
+    def save_usage_series(
+        self,
+        series: list[dict],
+        service_location_number: str,
+        account_number: str,
+        time_frame: str = "HOURLY",
+        append_only: bool = False,
+    ) -> int:
+        """
+        Save several meters' usage series as one frame (electricity, gas, water).
+        Unlike repeated save_usage_data calls, all points are converted in
+        one pass, with the per-series identifiers repeated column-wise.
+
+        Args:
+            series: Series dicts with 'data' (points with 'x' and 'y'
+                values), 'meter_number', 'utility_type', 'unit_of_measure'
+                and 'data_type'
+            service_location_number: Service location identifier
+            account_number: Account number
+            time_frame: Time frame of the data (HOURLY, DAILY, etc.)
+            append_only: The points are known not to be stored yet, so they
+                are appended without checking for existing rows
 
-        df = pd.DataFrame(records)
+        Returns:
+            Number of records written
+        """
+        series = [entry for entry in series if entry["data"]]
+        if not series:
+            return 0
 
-        # Check if table exists for merge, otherwise create it
-        try:
-            dt = DeltaTable(self.usage_path)
-
-            # Perform merge (upsert) to avoid duplicates
-            # Match on timestamp_ms + meter_number as unique key
-            (
-                dt.merge(
-                    source=df,
-                    predicate="t.timestamp_ms = s.timestamp_ms AND t.meter_number = s.meter_number AND t.utility_type = s.utility_type AND t.data_type = s.data_type",
-                    source_alias="s",
-                    target_alias="t",
-                )
-                .when_matched_update_all()
-                .when_not_matched_insert_all()
-                .execute()
+        lengths = [len(entry["data"]) for entry in series]
+        n = sum(lengths)
+        xs, ys = zip(
+            *map(
+                operator.itemgetter("x", "y"),
+                chain.from_iterable(entry["data"] for entry in series),
             )
+        )
+
+        def per_row(name: str) -> np.ndarray:
+            return np.repeat([entry[name] for entry in series], lengths)
+
+        df = _usage_frame(
+            xs,
+            ys,
+            {
+                "unit_of_measure": pd.Categorical(per_row("unit_of_measure")),
+                "utility_type": per_row("utility_type").astype(object),
+                "data_type": per_row("data_type").astype(object),
+                "meter_number": pd.Categorical(per_row("meter_number")),
+                "service_location_number": _constant_column(n, service_location_number),
+                "account_number": _constant_column(n, account_number),
+                "time_frame": _constant_column(n, time_frame),
+            },
+        )
+        self._save_frame(df, append_only)
+        return len(df)
+
+    def _save_frame(self, df: pd.DataFrame, append_only: bool):
+        """Merge a frame of usage rows now, or buffer it inside a batch."""
+        if self._batch_depth:
+            # Buffered single points go first, keeping the saves in order
+            self._collect_pending_points()
+            self._pending_usage.append(df)
+            self._pending_usage_rows += len(df)
+            self._pending_append_only = self._pending_append_only and append_only
+            if self._pending_usage_rows >= self.max_pending_rows:
+                self.flush()
+        else:
+            self._merge_usage(df, append_only)
+
+    def _has_stored_keys(self, dt: DeltaTable, source: pa.Table) -> bool:
+        """Return whether any row of the table may share a key with source."""
+        # Only the partitions being written are scanned, and within them only
+        # rows for the same meters and time span can collide
+        span = pc.min_max(source["datetime_utc"])
+        key_filter = (
+            pc.field("date").isin(pc.unique(source["date"]))
+            & pc.field("utility_type").isin(pc.unique(source["utility_type"]))
+            & pc.field("data_type").isin(pc.unique(source["data_type"]))
+            & pc.field("meter_number").isin(pc.unique(source["meter_number"]))
+            & (pc.field("datetime_utc") >= span["min"])
+            & (pc.field("datetime_utc") <= span["max"])
+        )
+        return dt.to_pyarrow_dataset().count_rows(filter=key_filter) > 0
+
+    def _merge_usage(self, df: pd.DataFrame, append_only: bool = False):
+        """Upsert usage rows into the usage table in one transaction."""
+        # One ingestion time per commit, sampled once and broadcast
+        df["ingested_at"] = pd.Timestamp.now(tz="UTC").as_unit("ns")
 
-        except Exception:
-            # Table doesn't exist yet, create it with initial write
+        # Create the table with an initial write if it doesn't exist yet;
+        # any error opening or merging into an existing table propagates
+        # rather than being mistaken for a missing table
+        if self._usage_dt is None and not (self.usage_dir / "_delta_log").exists():
             write_deltalake(
                 self.usage_path,
-                df,
+                # datetime_utc already holds the millisecond timestamps
+                df.drop(columns="timestamp_ms"),
                 mode="append",
                 schema_mode="merge",
                 partition_by=["date", "utility_type", "data_type"],
+                configuration={
+                    "delta.targetFileSize": str(_TARGET_FILE_SIZE),
+                    # Statistics cover the leading columns, through
+                    # meter_number, which is all read filters use
+                    "delta.dataSkippingNumIndexedCols": "7",
+                },
             )
+            return
+
+        dt = self._usage_table()
+        if self._usage_schema is None:
+            self._usage_schema = pa.schema(dt.schema().to_arrow())
+        # Hand the merge an Arrow table already in the target's types, so
+        # no per-call type inference or casts end up in the merge plan.
+        # Columns the source doesn't carry are left out.
+        source = pa.Table.from_pandas(
+            df,
+            schema=pa.schema(f for f in self._usage_schema if f.name in df.columns),
+            preserve_index=False,
+        )
 
-        return len(records)
+        # Purely new rows (the usual "latest hours" fetch) have nothing to
+        # match, so they skip the merge's join against the target
+        if append_only or not self._has_stored_keys(dt, source):
+            write_deltalake(
+                dt,
+                source,
+                mode="append",
+                schema_mode="merge",
+                partition_by=["date", "utility_type", "data_type"],
+            )
+            return
+
+        # Perform merge (upsert) to avoid duplicates
+        # Match on datetime_utc + meter_number as unique key. The partition
+        # columns are also constrained to the values being written, as
+        # literals, so only the affected partitions of the target are scanned.
+        predicate = (
+            f"t.date IN ({_sql_list(df['date'])})"
+            f" AND t.utility_type IN ({_sql_list(df['utility_type'])})"
+            f" AND t.data_type IN ({_sql_list(df['data_type'])})"
+            " AND t.datetime_utc = s.datetime_utc"
+            " AND t.meter_number = s.meter_number"
+            " AND t.utility_type = s.utility_type"
+            " AND t.data_type = s.data_type"
+        )
+        (
+            dt.merge(
+                source=source,
+                predicate=predicate,
+                source_alias="s",
+                target_alias="t",
+            )
+            # Re-fetched hours mostly carry unchanged values; updating
+            # only changed rows leaves files without changes unrewritten
+            .when_matched_update_all(
+                predicate="(t.usage_value IS DISTINCT FROM s.usage_value)"
+                " OR (t.unit_of_measure IS DISTINCT FROM s.unit_of_measure)"
+            )
+            .when_not_matched_insert_all()
+            .execute()
+        )
 
     def save_electricity_data(
         self,
@@ -226,6 +617,8 @@ class EnergyDeltaStorage:
     ):
         """
         Save metadata about a data fetch operation.
+        Rows are appended to a JSON-lines log rather than committed to the
+        metadata table one at a time; see compact_metadata().
 
         Args:
             industry: Industry type (ELECTRIC, GAS, WATER)
@@ -236,28 +629,66 @@ class EnergyDeltaStorage:
             service_location_number: Service location identifier
             account_number: Account number
         """
-        metadata = pd.DataFrame(
-            [
-                {
-                    "fetch_timestamp": pd.Timestamp.now(tz="UTC"),
-                    "industry": industry,
-                    "time_frame": time_frame,
-                    "start_datetime_ms": start_datetime,
-                    "end_datetime_ms": end_datetime,
-                    "start_datetime": pd.to_datetime(
-                        start_datetime, unit="ms", utc=True
-                    ),
-                    "end_datetime": pd.to_datetime(end_datetime, unit="ms", utc=True),
-                    "records_written": records_written,
-                    "service_location_number": service_location_number,
-                    "account_number": account_number,
-                }
-            ]
+        self._pending_metadata.append(
+            {
+                "fetch_timestamp": datetime.now(timezone.utc).isoformat(),
+                "industry": industry,
+                "time_frame": time_frame,
+                "start_datetime_ms": start_datetime,
+                "end_datetime_ms": end_datetime,
+                "records_written": records_written,
+                "service_location_number": service_location_number,
+                "account_number": account_number,
+            }
         )
+        if not self._batch_depth:
+            self.flush()
+
+    def has_window(
+        self,
+        industry: str,
+        time_frame: str,
+        start_datetime: int,
+        end_datetime: int,
+        service_location_number: str,
+        account_number: str,
+    ) -> bool:
+        """
+        Check whether an earlier fetch this hour already saved a query window.
+        Window ends are rounded up to the time frame's bucket boundary, so a
+        DAILY or MONTHLY end is shared by every run that day or month; only
+        fetches made in the current hour count, so the still-changing bucket
+        is refreshed by later runs.
 
-        write_deltalake(
-            self.metadata_path, metadata, mode="append", schema_mode="merge"
+        Args:
+            industry: Industry type (ELECTRIC, GAS, WATER)
+            time_frame: Time frame queried
+            start_datetime: Start timestamp in ms
+            end_datetime: End timestamp in ms
+            service_location_number: Service location identifier
+            account_number: Account number
+
+        Returns:
+            True if a fetch this hour that wrote records covered the window
+        """
+        try:
+            df = self.read_fetch_metadata()
+        except FileNotFoundError:
+            return False
+
+        hour_start = pd.Timestamp.now(tz=timezone.utc).floor("h")
+        fetched_at = pd.to_datetime(df["fetch_timestamp"], utc=True, format="ISO8601")
+        covered = (
+            (fetched_at >= hour_start)
+            & (df["industry"] == industry)
+            & (df["time_frame"] == time_frame)
+            & (df["service_location_number"] == service_location_number)
+            & (df["account_number"] == account_number)
+            & (df["records_written"] > 0)
+            & (df["start_datetime_ms"] <= start_datetime)
+            & (df["end_datetime_ms"] // _MS_PER_HOUR >= end_datetime // _MS_PER_HOUR)
         )
+        return bool(covered.any())
 
     def read_usage_data(
         self,
@@ -281,37 +712,73 @@ class EnergyDeltaStorage:
             DataFrame with usage data
         """
         try:
-            dt = DeltaTable(self.usage_path)
+            dt = self._usage_table(max_age=_READ_REFRESH_INTERVAL)
 
-            # Build partition filters for efficient querying
-            filters = []
+            # Push every filter into the Arrow scan: partition columns prune
+            # whole files, the rest skip row groups by their statistics
+            conditions = []
             if utility_type:
-                filters.append(("utility_type", "=", utility_type))
+                conditions.append(pc.field("utility_type") == utility_type)
             if data_type:
-                filters.append(("data_type", "=", data_type))
-
-            # Use to_pandas with filters if available
-            if filters:
-                df = dt.to_pandas(filters=filters)
-            else:
-                df = dt.to_pandas()
-
-            # Apply additional filters
+                conditions.append(pc.field("data_type") == data_type)
             if start_date:
                 start_dt = pd.to_datetime(start_date, utc=True)
-                df = df[df["datetime_utc"] >= start_dt]
+                conditions.append(pc.field("date") >= start_dt.date())
+                conditions.append(pc.field("datetime_utc") >= start_dt.to_pydatetime())
             if end_date:
                 # Add one day to end_date to include the full day
                 end_dt = pd.to_datetime(end_date, utc=True) + pd.Timedelta(days=1)
-                df = df[df["datetime_utc"] < end_dt]
+                conditions.append(pc.field("date") <= end_dt.date())
+                conditions.append(pc.field("datetime_utc") < end_dt.to_pydatetime())
             if meter_number:
-                df = df[df["meter_number"] == meter_number]
+                conditions.append(pc.field("meter_number") == meter_number)
+
+            scan_filter = reduce(operator.and_, conditions) if conditions else None
+            dataset = dt.to_pyarrow_dataset()
+            df = dataset.to_table(
+                columns=_usage_projection(dataset.schema), filter=scan_filter
+            ).to_pandas()
 
-            return df.sort_values("datetime_utc")
+            return _with_date_parts(df).sort_values("datetime_utc")
         except Exception as e:
             print(f"Error reading Delta table: {e}")
             return pd.DataFrame()
 
+    def read_usage_batches(
+        self,
+        utility_type: Optional[str] = None,
+        data_type: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+        batch_size: int = 65_536,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream usage data from Delta Lake as Arrow record batches.
+        Unlike read_usage_data, the table is never materialized in full, so
+        memory stays bounded by batch_size however much history is stored.
+
+        Args:
+            utility_type: Filter by utility type (ELECTRIC, GAS, WATER)
+            data_type: Filter by data type (USAGE or COST)
+            columns: Columns to read (default: all, including timestamp_ms)
+            batch_size: Maximum number of rows per record batch
+
+        Returns:
+            RecordBatchReader over the matching rows
+        """
+        dt = self._usage_table(max_age=_READ_REFRESH_INTERVAL)
+
+        # Partition filters prune whole files before any data is read
+        partitions = []
+        if utility_type:
+            partitions.append(("utility_type", "=", utility_type))
+        if data_type:
+            partitions.append(("data_type", "=", data_type))
+
+        dataset = dt.to_pyarrow_dataset(partitions=partitions or None)
+        return dataset.scanner(
+            columns=_usage_projection(dataset.schema, columns), batch_size=batch_size
+        ).to_reader()
+
     def read_electricity_data(
         self,
         start_date: Optional[str] = None,
@@ -342,43 +809,98 @@ class EnergyDeltaStorage:
         stats = {}
 
         try:
-            # Overall usage stats (only count USAGE records, not COST)
-            dt = DeltaTable(self.usage_path)
-            df = dt.to_pandas(filters=[("data_type", "=", "USAGE")])
+            # Overall usage stats (only count USAGE records, not COST). Only
+            # the columns the stats need are scanned, one record batch at a
+            # time, so memory stays bounded however large the table grows.
+            version = self._usage_table(max_age=_READ_REFRESH_INTERVAL).version()
+            reader = self.read_usage_batches(
+                data_type="USAGE",
+                columns=[
+                    "date",
+                    "utility_type",
+                    "datetime_utc",
+                    "usage_value",
+                    "unit_of_measure",
+                    "meter_number",
+                ],
+            )
 
+            # Running aggregates per utility type, plus the distinct
+            # (utility, meter) and (date, utility) pairs seen so far
+            totals: dict[str, dict] = {}
+            meters: set[tuple[str, str]] = set()
+            partitions: set[tuple[object, str]] = set()
+            for batch in reader:
+                if batch.num_rows == 0:
+                    continue
+                table = pa.Table.from_batches([batch])
+                by_utility = table.group_by(
+                    "utility_type", use_threads=False
+                ).aggregate(
+                    [
+                        ([], "count_all"),
+                        ("datetime_utc", "min"),
+                        ("datetime_utc", "max"),
+                        ("usage_value", "sum", pc.ScalarAggregateOptions(min_count=0)),
+                        ("usage_value", "count"),
+                        ("unit_of_measure", "first"),
+                    ]
+                )
+                for row in by_utility.to_pylist():
+                    total = totals.get(row["utility_type"])
+                    if total is None:
+                        totals[row["utility_type"]] = row
+                        continue
+                    total["count_all"] += row["count_all"]
+                    total["datetime_utc_min"] = min(
+                        total["datetime_utc_min"], row["datetime_utc_min"]
+                    )
+                    total["datetime_utc_max"] = max(
+                        total["datetime_utc_max"], row["datetime_utc_max"]
+                    )
+                    total["usage_value_sum"] += row["usage_value_sum"]
+                    total["usage_value_count"] += row["usage_value_count"]
+                meters.update(_distinct_pairs(table, "utility_type", "meter_number"))
+                partitions.update(_distinct_pairs(table, "date", "utility_type"))
+
+            total_records = sum(total["count_all"] for total in totals.values())
+            starts = [total["datetime_utc_min"] for total in totals.values()]
+            ends = [total["datetime_utc_max"] for total in totals.values()]
             stats["overall"] = {
-                "total_records": len(df),
+                "total_records": total_records,
                 "date_range": {
-                    "min": str(df["datetime_utc"].min()) if len(df) > 0 else None,
-                    "max": str(df["datetime_utc"].max()) if len(df) > 0 else None,
+                    "min": str(min(starts)) if total_records else None,
+                    "max": str(max(ends)) if total_records else None,
                 },
-                "unique_meters": df["meter_number"].nunique(),
-                "table_version": dt.version(),
-                "partition_count": len(df[["date", "utility_type"]].drop_duplicates()),
+                "unique_meters": len({meter for _, meter in meters}),
+                "table_version": version,
+                "partition_count": len(partitions),
             }
 
             # Stats by utility type (only USAGE records)
             for utility in ["ELECTRIC", "GAS", "WATER"]:
-                utility_df = df[df["utility_type"] == utility]
-                if len(utility_df) > 0:
+                if utility in totals:
+                    total = totals[utility]
                     stats[utility.lower()] = {
-                        "total_records": len(utility_df),
+                        "total_records": total["count_all"],
                         "date_range": {
-                            "min": str(utility_df["datetime_utc"].min()),
-                            "max": str(utility_df["datetime_utc"].max()),
+                            "min": str(total["datetime_utc_min"]),
+                            "max": str(total["datetime_utc_max"]),
                         },
-                        "total_usage": float(utility_df["usage_value"].sum()),
-                        "avg_usage": float(utility_df["usage_value"].mean()),
-                        "unit": utility_df["unit_of_measure"].iloc[0],
-                        "unique_meters": utility_df["meter_number"].nunique(),
+                        "total_usage": float(total["usage_value_sum"]),
+                        "avg_usage": total["usage_value_sum"]
+                        / total["usage_value_count"],
+                        "unit": total["unit_of_measure_first"],
+                        "unique_meters": sum(
+                            1 for meter_utility, _ in meters if meter_utility == utility
+                        ),
                     }
         except Exception as e:
             stats["usage"] = {"error": f"No usage data found: {e}"}
 
         try:
             # Metadata stats
-            dt_meta = DeltaTable(self.metadata_path)
-            df_meta = dt_meta.to_pandas()
+            df_meta = self.read_fetch_metadata()
 
             stats["fetch_history"] = {
                 "total_fetches": len(df_meta),
@@ -387,19 +909,80 @@ class EnergyDeltaStorage:
                 else None,
                 "total_records_fetched": int(df_meta["records_written"].sum()),
             }
-        except Exception:
+        except FileNotFoundError:
             stats["fetch_history"] = {"error": "No metadata found"}
+        except Exception as e:
+            stats["fetch_history"] = {"error": f"Could not read metadata: {e}"}
 
         return stats
 
+    def _read_metadata_log(self) -> Optional[pd.DataFrame]:
+        """Read logged fetch metadata not yet compacted, or None if none."""
+        try:
+            with self.metadata_log_path.open() as log:
+                rows = [json.loads(line) for line in log if line.strip()]
+        except FileNotFoundError:
+            return None
+        if not rows:
+            return None
+
+        df = pd.DataFrame(rows)
+        df["fetch_timestamp"] = pd.to_datetime(df["fetch_timestamp"], utc=True)
+        df["start_datetime"] = pd.to_datetime(
+            df["start_datetime_ms"], unit="ms", utc=True
+        )
+        df["end_datetime"] = pd.to_datetime(df["end_datetime_ms"], unit="ms", utc=True)
+        return df
+
+    def read_fetch_metadata(self) -> pd.DataFrame:
+        """
+        Read fetch metadata: the metadata table plus any rows still in the log.
+
+        Raises:
+            FileNotFoundError: If no fetch metadata has been saved
+        """
+        frames = []
+        # Only a missing table counts as empty; other errors propagate rather
+        # than leaving callers with partial history
+        if (Path(self.metadata_path) / "_delta_log").exists():
+            frames.append(self._metadata_table().to_pandas())
+        log_df = self._read_metadata_log()
+        if log_df is not None:
+            frames.append(log_df)
+        if not frames:
+            raise FileNotFoundError(self.metadata_path)
+        return pd.concat(frames, ignore_index=True)
+
+    def compact_metadata(self):
+        """
+        Move logged fetch metadata into the metadata Delta table in one commit.
+        Run this periodically; optimize_table() does it as well.
+        """
+        log_df = self._read_metadata_log()
+        if log_df is not None:
+            write_deltalake(
+                self.metadata_path, log_df, mode="append", schema_mode="merge"
+            )
+        self.metadata_log_path.unlink(missing_ok=True)
+
     def optimize_table(self):
         """
         Optimize the Delta table by compacting small files.
         Run this periodically after many appends.
+
+        Rows are Z-ordered by meter and time while being compacted, so
+        meter and date range reads skip unrelated files and row groups.
         """
         try:
-            dt = DeltaTable(self.usage_path)
-            dt.optimize.compact()
+            self.compact_metadata()
+        except Exception as e:
+            print(f"Could not compact fetch metadata: {e}")
+
+        try:
+            dt = self._usage_table()
+            dt.optimize.z_order(
+                ["meter_number", "datetime_utc"], target_size=_TARGET_FILE_SIZE
+            )
             print(f"✓ Optimized usage table (version {dt.version()})")
         except Exception as e:
             print(f"Could not optimize table: {e}")
@@ -412,7 +995,7 @@ class EnergyDeltaStorage:
             retention_hours: Hours of retention for old files
         """
         try:
-            dt = DeltaTable(self.usage_path)
+            dt = self._usage_table()
             dt.vacuum(retention_hours=retention_hours, enforce_retention_duration=False)
             print("✓ Vacuumed old files from usage table")
         except Exception as e:
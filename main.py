@@ -1,38 +1,273 @@
 import argparse
+import hashlib
 import json
+import logging
 import os
+import random
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Optional
+
 import requests
 from dotenv import load_dotenv
 
+try:
+    # Optional: several times faster JSON encoding and decoding
+    import orjson
+except ImportError:
+    orjson = None
+
 from delta_storage import EnergyDeltaStorage
 
+_LOGGER = logging.getLogger(__name__)
+
+# Industries the API serves; get_usage_data_by_industry polls them at once
+INDUSTRIES = ["WATER", "GAS", "ELECTRIC"]
+
+# Upper bound for a single backoff sleep while polling for pending data
+MAX_POLL_DELAY = 30
+
+# Seconds a completed usage response is reused for an identical request, by
+# time frame; request windows are compared at hour granularity. Only windows
+# ending by the start of the current bucket are cached, since the partly
+# elapsed bucket's totals still change
+USAGE_CACHE_TTL = {"HOURLY": 3600, "DAILY": 12 * 3600, "MONTHLY": 7 * 24 * 3600}
+MS_PER_HOUR = 3_600_000
+
+# Long windows are fetched in slices of this length (ms), by time frame, so
+# the API materializes them in parallel; at most MAX_FETCH_WORKERS requests
+# are polled at once
+WINDOW_CHUNK_MS = {"HOURLY": 86_400_000}
+MAX_FETCH_WORKERS = 8
+
+# Access tokens are kept here between runs, and reused until shortly before
+# they expire (seconds); tokens without a reported lifetime get the default
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "hsv_utility" / "token.json"
+TOKEN_EXPIRY_MARGIN = 60
+DEFAULT_TOKEN_TTL = 1800
+
+
+def backoff_delay(retry_delay: float, attempt: int) -> float:
+    """Return an exponentially growing, jittered delay for a polling attempt."""
+    delay = min(retry_delay * (2 ** (attempt - 1)), MAX_POLL_DELAY)
+    return delay * (0.5 + random.random())
+
+
+def bucket_start(moment: datetime, time_frame: str) -> datetime:
+    """Return the start of the time-frame bucket (hour, day or month) of a moment."""
+    if time_frame == "HOURLY":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if time_frame == "DAILY":
+        return start
+    return start.replace(day=1)
+
+
+def bucket_end(moment: datetime, time_frame: str) -> datetime:
+    """
+    Return the end of the time-frame bucket (hour, day or month) containing
+    a moment, so runs within the same bucket query identical windows.
+    Rounding up keeps the partly elapsed bucket in the window.
+    """
+    start = bucket_start(moment, time_frame)
+    if time_frame == "HOURLY":
+        return start + timedelta(hours=1)
+    if time_frame == "DAILY":
+        return start + timedelta(days=1)
+    # MONTHLY: the first day of the next month
+    return (start + timedelta(days=32)).replace(day=1)
+
+
+def _window_chunks(
+    start_ms: int, end_ms: int, time_frame: str
+) -> list[tuple[int, int]]:
+    """
+    Split a query window into consecutive (start, end) slices. Each slice but
+    the last ends 1 ms before the next one starts, so no point is fetched by
+    two slices even if the API treats the end as inclusive.
+    """
+    step = WINDOW_CHUNK_MS.get(time_frame)
+    if not step or end_ms - start_ms <= step:
+        return [(start_ms, end_ms)]
+    return [
+        (start, start + step - 1 if start + step < end_ms else end_ms)
+        for start in range(start_ms, end_ms, step)
+    ]
+
+
+def _merge_datasets(datasets: list[dict]) -> list[dict]:
+    """
+    Merge an industry's datasets from several window slices into one dataset
+    per type, with one series per meter whose points are deduplicated on x.
+    """
+    merged: dict[str, dict] = {}
+    series_by_key: dict[tuple[str, str], dict] = {}
+    seen_by_key: dict[tuple[str, str], set] = {}
+    for dataset in datasets:
+        data_type = dataset.get("type", "USAGE")
+        if data_type not in merged:
+            merged[data_type] = {**dataset, "series": []}
+        for series in dataset.get("series", []):
+            key = (data_type, series.get("meterNumber", "unknown"))
+            if key not in series_by_key:
+                series_by_key[key] = {**series, "data": []}
+                seen_by_key[key] = set()
+                merged[data_type]["series"].append(series_by_key[key])
+            seen = seen_by_key[key]
+            for point in series.get("data", []):
+                if point["x"] not in seen:
+                    seen.add(point["x"])
+                    series_by_key[key]["data"].append(point)
+    return list(merged.values())
+
+
+def encode_json(obj, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def read_json(response: requests.Response):
+    """
+    Decode a JSON response body straight from its raw bytes.
+
+    Usage payloads can be large; parsing the bytes directly avoids the
+    decoded text copy (and encoding detection) of Response.json(). orjson
+    is used when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
 
 class UtilityAPIClient:
     """Client for interacting with HSV Utility SmartHub API."""
 
-    def __init__(self, username: str, password: str):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        cache_dir: Optional[str] = None,
+        token_cache_path: Optional[Path] = TOKEN_CACHE_PATH,
+    ):
+        """
+        Initialize the API client.
+
+        Args:
+            username: Utility account username/email
+            password: Utility account password
+            cache_dir: Directory for cached usage responses (default: no cache)
+            token_cache_path: File the access token is kept in between runs
+                (None: always authenticate)
+        """
         self.username = username
         self.password = password
         self.base_url = "https://hsvutil.smarthub.coop"
         self.auth_url = f"{self.base_url}/services/oauth/auth/v2"
         self.session = requests.Session()
+        # Usage requests all send JSON; authentication overrides this with
+        # its form encoding
+        self.session.headers["Content-Type"] = "application/json"
+        # Every request goes to one host; keep a warm keep-alive connection
+        # for each request polled concurrently, so polls reuse their TLS
+        # connection instead of reconnecting
+        self.session.mount(
+            self.base_url,
+            requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=MAX_FETCH_WORKERS
+            ),
+        )
         self.access_token: Optional[str] = None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.token_cache_path = token_cache_path
+        # Industries are polled from several threads; only one of them
+        # replaces a rejected token
+        self._auth_lock = threading.Lock()
+
+    def _usage_cache_path(self, payload: dict) -> Optional[Path]:
+        """Return the cache file for a usage request, or None if not caching."""
+        if self.cache_dir is None:
+            return None
+        key = dict(
+            payload,
+            startDateTime=payload["startDateTime"] // MS_PER_HOUR,
+            endDateTime=payload["endDateTime"] // MS_PER_HOUR,
+        )
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _set_access_token(self, token: str):
+        """Send the access token with every following request."""
+        self.access_token = token
+        self.session.headers.update({"Authorization": f"Bearer {token}"})
 
-    def authenticate(self) -> bool:
+    def _load_cached_token(self) -> bool:
+        """Reuse this user's cached access token if it is still valid."""
+        if self.token_cache_path is None:
+            return False
+        try:
+            cached = json.loads(self.token_cache_path.read_text())
+        except (OSError, ValueError):
+            return False
+        if (
+            cached.get("username") != self.username
+            or cached.get("expires_at", 0) <= time.time() + TOKEN_EXPIRY_MARGIN
+        ):
+            return False
+        self._set_access_token(cached["token"])
+        return True
+
+    def _save_cached_token(self, expires_in: Optional[float]):
+        """Cache the access token, readable only by the current user."""
+        if self.token_cache_path is None:
+            return
+        cached = {
+            "username": self.username,
+            "token": self.access_token,
+            "expires_at": time.time() + (expires_in or DEFAULT_TOKEN_TTL),
+        }
+        try:
+            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(
+                self.token_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(cached, f)
+        except OSError as e:
+            _LOGGER.warning("⚠ Could not cache access token: %s", e)
+
+    def _clear_cached_token(self):
+        """Forget the access token, in memory and on disk."""
+        self.access_token = None
+        self.session.headers.pop("Authorization", None)
+        if self.token_cache_path is not None:
+            self.token_cache_path.unlink(missing_ok=True)
+
+    def authenticate(self, use_cache: bool = True) -> bool:
         """
         Authenticate with the utility provider's OAuth endpoint.
 
+        Args:
+            use_cache: Reuse an access token cached by an earlier run, if it
+                is still valid, instead of authenticating
+
         Returns:
             bool: True if authentication successful, False otherwise
         """
+        if use_cache and self._load_cached_token():
+            _LOGGER.info("✓ Using cached access token")
+            return True
+
         payload = {"userId": self.username, "password": self.password}
 
         try:
-            print(f"Authenticating with {self.auth_url}...")
+            _LOGGER.info("Authenticating with %s...", self.auth_url)
             # Try form-encoded data instead of JSON (415 error suggests JSON not accepted)
             response = self.session.post(
                 self.auth_url,
@@ -41,7 +276,7 @@ class UtilityAPIClient:
             )
 
             if response.status_code == 200:
-                print("✓ Authentication successful!")
+                _LOGGER.info("✓ Authentication successful!")
                 # Store the response data - adjust based on actual API response
                 self.auth_response = response.json()
 
@@ -52,23 +287,58 @@ class UtilityAPIClient:
                     ) or self.auth_response.get("accessToken")
 
                     if self.access_token:
-                        print("✓ Access token obtained")
-                        self.session.headers.update(
-                            {"Authorization": f"Bearer {self.access_token}"}
+                        _LOGGER.info("✓ Access token obtained")
+                        self._set_access_token(self.access_token)
+                        expires_in = self.auth_response.get(
+                            "expires_in"
+                        ) or self.auth_response.get("expiresIn")
+                        self._save_cached_token(
+                            expires_in if isinstance(expires_in, (int, float)) else None
                         )
 
                 return True
             else:
-                print(
-                    f"✗ Authentication failed with status code: {response.status_code}"
+                _LOGGER.error(
+                    "✗ Authentication failed with status code: %s", response.status_code
                 )
-                print(f"Response: {response.text}")
+                _LOGGER.error("Response: %s", response.text)
                 return False
 
         except requests.exceptions.RequestException as e:
-            print(f"✗ Error during authentication: {e}")
+            _LOGGER.error("✗ Error during authentication: %s", e)
             return False
 
+    def _post_usage(self, usage_url: str, body: bytes) -> requests.Response:
+        """
+        Send a usage request, authenticating first if it is rejected.
+
+        Authentication is lazy: requests go out with the cached access token,
+        if any, and the auth endpoint is only called on a 401 (once per
+        rejected token, however many industry threads saw it rejected).
+        """
+        if self.access_token is None:
+            with self._auth_lock:
+                if self.access_token is None:
+                    self._load_cached_token()
+
+        sent_token = self.access_token
+        response = self.session.post(usage_url, data=body)
+        if response.status_code != 401:
+            return response
+
+        with self._auth_lock:
+            if self.access_token != sent_token:
+                # Another industry's thread has already authenticated again
+                authenticated = True
+            else:
+                if sent_token:
+                    _LOGGER.warning("⚠ Access token rejected, authenticating again")
+                    self._clear_cached_token()
+                authenticated = self.authenticate(use_cache=False)
+        if not authenticated:
+            return response
+        return self.session.post(usage_url, data=body)
+
     def get_usage_data(
         self,
         service_location_number: str,
@@ -79,7 +349,7 @@ class UtilityAPIClient:
         industries: list[str] = None,
         include_demand: bool = False,
         max_retries: int = 10,
-        retry_delay: int = 2,
+        retry_delay: float = 0.5,
     ) -> dict:
         """
         Retrieve energy usage data from the utility API.
@@ -93,13 +363,14 @@ class UtilityAPIClient:
             industries: List of industries to query (WATER, GAS, ELECTRIC)
             include_demand: Whether to include demand data
             max_retries: Maximum number of polling attempts (default: 10)
-            retry_delay: Seconds to wait between polling attempts (default: 2)
+            retry_delay: Seconds to wait before the first poll (default: 0.5);
+                the delay doubles on each attempt, up to MAX_POLL_DELAY
 
         Returns:
             dict: Usage data response from API
         """
         if industries is None:
-            industries = ["WATER", "GAS", "ELECTRIC"]
+            industries = list(INDUSTRIES)
 
         usage_url = f"{self.base_url}/services/secured/utility-usage/poll"
 
@@ -115,49 +386,72 @@ class UtilityAPIClient:
             "endDateTime": end_datetime,
         }
 
+        # Reuse a recent completed response for the same request; finalized
+        # hours and days don't change, so there's no need to poll again.
+        # Windows reaching into the current bucket are never cached
+        ttl = USAGE_CACHE_TTL.get(time_frame)
+        current_start = bucket_start(datetime.now(tz=timezone.utc), time_frame)
+        finalized = end_datetime <= current_start.timestamp() * 1000
+        cache_path = self._usage_cache_path(payload) if ttl and finalized else None
         try:
-            print(f"\nFetching usage data from {usage_url}...")
-            print(f"Time frame: {time_frame}")
-            print(f"Industries: {', '.join(industries)}")
+            if cache_path and time.time() - cache_path.stat().st_mtime < ttl:
+                _LOGGER.info(
+                    "\n✓ Using cached usage data for %s", ", ".join(industries)
+                )
+                return json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            pass
+
+        try:
+            _LOGGER.info("\nFetching usage data from %s...", usage_url)
+            _LOGGER.info("Time frame: %s", time_frame)
+            _LOGGER.info("Industries: %s", ", ".join(industries))
+
+            # The payload is the same for every poll, so it is encoded once
+            body = encode_json(payload)
 
             # Initial request
-            response = self.session.post(
-                usage_url, json=payload, headers={"Content-Type": "application/json"}
-            )
+            response = self._post_usage(usage_url, body)
 
             if response.status_code != 200:
-                print(
-                    f"✗ Failed to retrieve usage data. Status code: {response.status_code}"
+                _LOGGER.error(
+                    "✗ Failed to retrieve usage data. Status code: %s",
+                    response.status_code,
                 )
-                print(f"Response: {response.text}")
+                _LOGGER.error("Response: %s", response.text)
                 return None
 
-            data = response.json()
+            data = read_json(response)
 
             # Check if data is pending - poll until ready
             retry_count = 0
             while data.get("status") == "PENDING" and retry_count < max_retries:
                 retry_count += 1
-                print(f"⏳ Data is pending... (attempt {retry_count}/{max_retries})")
-                time.sleep(retry_delay)
+                delay = backoff_delay(retry_delay, retry_count)
+                _LOGGER.info(
+                    "⏳ Data is pending... (attempt %d/%d, waiting %.1fs)",
+                    retry_count,
+                    max_retries,
+                    delay,
+                )
+                time.sleep(delay)
 
                 # Poll again with same payload
-                response = self.session.post(
-                    usage_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
+                response = self._post_usage(usage_url, body)
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = read_json(response)
                 else:
-                    print(f"✗ Polling failed. Status code: {response.status_code}")
+                    _LOGGER.error(
+                        "✗ Polling failed. Status code: %s", response.status_code
+                    )
                     return None
 
             # Check final status
             if data.get("status") == "PENDING":
-                print(
-                    f"✗ Data still pending after {max_retries} attempts. Try again later or increase retry limit."
+                _LOGGER.error(
+                    "✗ Data still pending after %s attempts. Try again later or increase retry limit.",
+                    max_retries,
                 )
                 return None
             elif (
@@ -165,21 +459,93 @@ class UtilityAPIClient:
                 or "data" in data
                 or len(data.keys()) > 1
             ):
-                print("✓ Usage data retrieved successfully!")
+                _LOGGER.info("✓ Usage data retrieved successfully!")
+                if cache_path and data.get("status") == "COMPLETE":
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_bytes(encode_json(data))
                 return data
             else:
-                print(
-                    f"✓ Response received with status: {data.get('status', 'unknown')}"
+                _LOGGER.info(
+                    "✓ Response received with status: %s", data.get("status", "unknown")
                 )
                 return data
 
         except requests.exceptions.RequestException as e:
-            print(f"✗ Error retrieving usage data: {e}")
+            _LOGGER.error("✗ Error retrieving usage data: %s", e)
             return None
 
+    def get_usage_data_by_industry(
+        self,
+        industries: list[str],
+        start_datetime: int,
+        end_datetime: int,
+        time_frame: str = "HOURLY",
+        **kwargs,
+    ) -> Optional[dict]:
+        """
+        Retrieve usage data with one concurrent request per industry and
+        window slice.
+
+        Hourly windows are split into day-long slices (see WINDOW_CHUNK_MS),
+        and each industry's slices are polled in a shared, bounded thread
+        pool, so pending waits overlap instead of adding up. Each slice's
+        completed response is cached separately. The session's connection
+        pool is shared between the threads.
 
-def parse_arguments():
-    """Parse command line arguments."""
+        Args:
+            industries: List of industries to query (WATER, GAS, ELECTRIC)
+            start_datetime: Start time in milliseconds since epoch
+            end_datetime: End time in milliseconds since epoch
+            time_frame: Time frame for data (HOURLY, DAILY, MONTHLY, etc.)
+            **kwargs: Other arguments for get_usage_data
+
+        Returns:
+            dict: Usage data responses merged into one, or None if any
+            request failed
+        """
+        requests_to_poll = [
+            (industry, start, end)
+            for industry in industries
+            for start, end in _window_chunks(start_datetime, end_datetime, time_frame)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_FETCH_WORKERS, len(requests_to_poll))
+        ) as executor:
+            responses = list(
+                executor.map(
+                    lambda request: self.get_usage_data(
+                        industries=[request[0]],
+                        start_datetime=request[1],
+                        end_datetime=request[2],
+                        time_frame=time_frame,
+                        **kwargs,
+                    ),
+                    requests_to_poll,
+                )
+            )
+
+        if any(response is None for response in responses):
+            return None
+
+        # Each response carries its industry's datasets under "data"; slices
+        # of one industry are merged back into one dataset per type, and the
+        # merged response is only COMPLETE if every response was
+        merged = dict(responses[0])
+        industry_datasets: dict[str, list[dict]] = {}
+        for response in responses:
+            for industry, datasets in (response.get("data") or {}).items():
+                industry_datasets.setdefault(industry, []).extend(datasets or [])
+            if response.get("status") != "COMPLETE":
+                merged["status"] = response.get("status")
+        merged["data"] = {
+            industry: _merge_datasets(datasets)
+            for industry, datasets in industry_datasets.items()
+        }
+        return merged
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description="Retrieve energy usage data from your utility provider"
     )
@@ -205,8 +571,8 @@ def parse_arguments():
         "-i",
         "--industries",
         nargs="+",
-        choices=["WATER", "GAS", "ELECTRIC"],
-        default=["WATER", "GAS", "ELECTRIC"],
+        choices=INDUSTRIES,
+        default=INDUSTRIES,
         help="Industries to query (default: all)",
     )
     parser.add_argument(
@@ -217,6 +583,17 @@ def parse_arguments():
         action="store_true",
         help="Don't save data to Delta Lake (only output JSON)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the API, even for cached responses or data already saved this hour",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Only report warnings and errors",
+    )
     parser.add_argument(
         "--delta-path",
         default="./energy_data",
@@ -230,12 +607,21 @@ def parse_arguments():
     )
     parser.add_argument(
         "--retry-delay",
-        type=int,
-        default=2,
-        help="Seconds to wait between polling attempts (default: 2)",
+        type=float,
+        default=0.5,
+        help="Seconds to wait before the first poll; doubles on each attempt (default: 0.5)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import, so repeated main() calls only parse
+_PARSER = _build_parser()
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    return _PARSER.parse_args()
 
 
 def get_credentials(args) -> tuple[Optional[str], Optional[str]]:
@@ -249,7 +635,7 @@ def get_credentials(args) -> tuple[Optional[str], Optional[str]]:
 
     # Priority 1: Command line arguments
     if args.username and args.password:
-        print("Using credentials from command line arguments")
+        _LOGGER.info("Using credentials from command line arguments")
         return args.username, args.password
 
     # Priority 2: Environment variables from .env file
@@ -258,7 +644,7 @@ def get_credentials(args) -> tuple[Optional[str], Optional[str]]:
     env_password = os.getenv("UTILITY_PASSWORD")
 
     if env_username and env_password:
-        print("Using credentials from .env file")
+        _LOGGER.info("Using credentials from .env file")
         return env_username, env_password
 
     # No credentials found
@@ -267,21 +653,23 @@ def get_credentials(args) -> tuple[Optional[str], Optional[str]]:
 
 def main():
     """Main entry point for the energy usage application."""
-    print("=== Energy Usage Data Retrieval ===\n")
-
     # Parse arguments
     args = parse_arguments()
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s"
+    )
+    _LOGGER.info("=== Energy Usage Data Retrieval ===\n")
 
     # Get credentials
     username, password = get_credentials(args)
 
     if not username or not password:
-        print("✗ Error: No credentials provided!")
-        print("\nPlease provide credentials either by:")
-        print(
+        _LOGGER.error("✗ Error: No credentials provided!")
+        _LOGGER.error("\nPlease provide credentials either by:")
+        _LOGGER.error(
             "  1. Command line: python main.py -u your_email@gmail.com -p your_password"
         )
-        print("  2. Create a .env file (see .env.example)")
+        _LOGGER.error("  2. Create a .env file (see .env.example)")
         sys.exit(1)
 
     # Get account details from args or env
@@ -289,49 +677,74 @@ def main():
     account_number = args.account_number or os.getenv("ACCOUNT_NUMBER")
 
     if not service_location or not account_number:
-        print("✗ Error: Service location number and account number required!")
-        print("\nProvide via command line or add to .env file:")
-        print("  SERVICE_LOCATION_NUMBER=your_service_location")
-        print("  ACCOUNT_NUMBER=your_account_number")
-        sys.exit(1)
-
-    # Create API client and authenticate
-    client = UtilityAPIClient(username, password)
-
-    if not client.authenticate():
-        print("\n✗ Failed to authenticate. Please check your credentials.")
+        _LOGGER.error("✗ Error: Service location number and account number required!")
+        _LOGGER.error("\nProvide via command line or add to .env file:")
+        _LOGGER.error("  SERVICE_LOCATION_NUMBER=your_service_location")
+        _LOGGER.error("  ACCOUNT_NUMBER=your_account_number")
         sys.exit(1)
 
-    # Calculate time range
-    end_time = datetime.utcnow()
-    start_time = end_time - timedelta(days=args.days)
+    # Calculate time range: --days back from now, widened to whole
+    # hour/day/month buckets so runs in the same bucket query the same window
+    now = datetime.now(tz=timezone.utc)
+    start_time = bucket_start(now - timedelta(days=args.days), args.time_frame)
+    end_time = bucket_end(now, args.time_frame)
 
     # Convert to milliseconds since epoch
     start_ms = int(start_time.timestamp() * 1000)
     end_ms = int(end_time.timestamp() * 1000)
 
-    print(
-        f"\nQuerying data from {start_time.strftime('%Y-%m-%d')} to {end_time.strftime('%Y-%m-%d')}"
+    _LOGGER.info(
+        "\nQuerying data from %s to %s",
+        start_time.strftime("%Y-%m-%d"),
+        end_time.strftime("%Y-%m-%d"),
     )
 
-    # Get usage data
-    usage_data = client.get_usage_data(
+    storage = None if args.no_save else EnergyDeltaStorage(args.delta_path)
+
+    # Skip industries whose window an earlier run already saved, and the API
+    # altogether if that covers them all (unless the data itself is wanted)
+    industries = args.industries
+    if storage is not None and not args.output and not args.no_cache:
+        industries = [
+            industry
+            for industry in industries
+            if not storage.has_window(
+                industry=industry,
+                time_frame=args.time_frame,
+                start_datetime=start_ms,
+                end_datetime=end_ms,
+                service_location_number=service_location,
+                account_number=account_number,
+            )
+        ]
+        if not industries:
+            _LOGGER.info("\n✓ All requested data has already been saved this hour")
+            return
+
+    # Create API client
+    cache_dir = None if args.no_cache else os.path.join(args.delta_path, ".api_cache")
+    # Authentication happens on the first rejected request, so a still-valid
+    # cached access token saves the round-trip to the auth endpoint
+    client = UtilityAPIClient(username, password, cache_dir=cache_dir)
+
+    # Get usage data, fetching the industries and window slices concurrently
+    usage_data = client.get_usage_data_by_industry(
         service_location_number=service_location,
         account_number=account_number,
         start_datetime=start_ms,
         end_datetime=end_ms,
         time_frame=args.time_frame,
-        industries=args.industries,
+        industries=industries,
         max_retries=args.max_retries,
         retry_delay=args.retry_delay,
     )
 
     if usage_data:
-        print("\n=== Usage Data Retrieved ===")
+        _LOGGER.info("\n=== Usage Data Retrieved ===")
 
         # Pretty print a summary
         if isinstance(usage_data, dict):
-            print(f"\nResponse keys: {list(usage_data.keys())}")
+            _LOGGER.info("\nResponse keys: %s", list(usage_data.keys()))
 
         # Save to Delta Lake unless --no-save is specified
         if (
@@ -339,127 +752,121 @@ def main():
             and isinstance(usage_data, dict)
             and usage_data.get("status") == "COMPLETE"
         ):
-            print("\n=== Saving to Delta Lake ===")
-            storage = EnergyDeltaStorage(args.delta_path)
-
-            total_records = 0
-
-            # Process each industry's data
-            if "data" in usage_data:
-                for industry, industry_data in usage_data["data"].items():
-                    if not industry_data:
-                        continue
-
-                    for dataset in industry_data:
-                        # Get data type (USAGE or COST)
-                        data_type = dataset.get("type", "USAGE")
-
-                        # Extract metadata
-                        unit_of_measure = dataset.get("unitOfMeasure", "UNKNOWN")
-                        series_list = dataset.get("series", [])
-
-                        for series in series_list:
-                            data_points = series.get("data", [])
-                            meter_number = series.get("meterNumber", "unknown")
-
-                            if not data_points:
-                                continue
-
-                            # Save based on industry type
-                            if industry == "ELECTRIC":
-                                records_written = storage.save_usage_data(
-                                    data=data_points,
-                                    meter_number=meter_number,
-                                    service_location_number=service_location,
-                                    account_number=account_number,
-                                    utility_type="ELECTRIC",
-                                    unit_of_measure=unit_of_measure,
-                                    time_frame=args.time_frame,
-                                    data_type=data_type,
-                                )
-                            elif industry == "GAS":
-                                records_written = storage.save_usage_data(
-                                    data=data_points,
-                                    meter_number=meter_number,
-                                    service_location_number=service_location,
-                                    account_number=account_number,
-                                    utility_type="GAS",
-                                    unit_of_measure=unit_of_measure,
-                                    time_frame=args.time_frame,
-                                    data_type=data_type,
-                                )
-                            elif industry == "WATER":
-                                records_written = storage.save_usage_data(
-                                    data=data_points,
-                                    meter_number=meter_number,
-                                    service_location_number=service_location,
-                                    account_number=account_number,
-                                    utility_type="WATER",
-                                    unit_of_measure=unit_of_measure,
-                                    time_frame=args.time_frame,
-                                    data_type=data_type,
+            _LOGGER.info("\n=== Saving to Delta Lake ===")
+
+            industry_records: Counter[str] = Counter()
+
+            # Buffer the saves and commit them together when the block exits
+            with storage.batch():
+                # Gather every series so all points are saved as one frame
+                series_rows = []
+                if "data" in usage_data:
+                    for industry, industry_data in usage_data["data"].items():
+                        if not industry_data:
+                            continue
+                        if industry not in INDUSTRIES:
+                            _LOGGER.warning("⚠ Unknown industry type: %s", industry)
+                            continue
+
+                        for dataset in industry_data:
+                            # Get data type (USAGE or COST)
+                            data_type = dataset.get("type", "USAGE")
+
+                            # Extract metadata
+                            unit_of_measure = dataset.get("unitOfMeasure", "UNKNOWN")
+                            series_list = dataset.get("series", [])
+
+                            for series in series_list:
+                                data_points = series.get("data", [])
+                                if not data_points:
+                                    continue
+
+                                series_rows.append(
+                                    {
+                                        "data": data_points,
+                                        "meter_number": series.get(
+                                            "meterNumber", "unknown"
+                                        ),
+                                        "utility_type": industry,
+                                        "unit_of_measure": unit_of_measure,
+                                        "data_type": data_type,
+                                    }
                                 )
-                            else:
-                                print(f"⚠ Unknown industry type: {industry}")
-                                continue
 
-                            total_records += records_written
-                            print(
-                                f"✓ Saved {records_written} {industry.lower()} {data_type.lower()} records (meter: {meter_number}, {unit_of_measure})"
-                            )
+                total_records = storage.save_usage_series(
+                    series_rows,
+                    service_location_number=service_location,
+                    account_number=account_number,
+                    time_frame=args.time_frame,
+                )
+                for series in series_rows:
+                    records_written = len(series["data"])
+                    industry = series["utility_type"]
+                    industry_records[industry] += records_written
+                    _LOGGER.info(
+                        "✓ Saved %d %s %s records (meter: %s, %s)",
+                        records_written,
+                        industry.lower(),
+                        series["data_type"].lower(),
+                        series["meter_number"],
+                        series["unit_of_measure"],
+                    )
+
+                # Save fetch metadata for each industry queried
+                if total_records > 0:
+                    for industry in industries:
+                        storage.save_fetch_metadata(
+                            industry=industry,
+                            time_frame=args.time_frame,
+                            start_datetime=start_ms,
+                            end_datetime=end_ms,
+                            records_written=industry_records[industry],
+                            service_location_number=service_location,
+                            account_number=account_number,
+                        )
 
-            # Save fetch metadata for each industry queried
             if total_records > 0:
-                for industry in args.industries:
-                    storage.save_fetch_metadata(
-                        industry=industry,
-                        time_frame=args.time_frame,
-                        start_datetime=start_ms,
-                        end_datetime=end_ms,
-                        records_written=total_records,
-                        service_location_number=service_location,
-                        account_number=account_number,
-                    )
-                print(f"\n✓ Total records saved: {total_records}")
+                _LOGGER.info("\n✓ Total records saved: %d", total_records)
 
                 # Print stats
                 stats = storage.get_stats()
-                print("\n=== Delta Lake Stats ===")
+                _LOGGER.info("\n=== Delta Lake Stats ===")
                 if "overall" in stats:
-                    print(f"Total records: {stats['overall']['total_records']}")
-                    print(f"Partitions: {stats['overall']['partition_count']}")
-                    print(
-                        f"Date range: {stats['overall']['date_range']['min']} to {stats['overall']['date_range']['max']}"
+                    _LOGGER.info("Total records: %d", stats["overall"]["total_records"])
+                    _LOGGER.info("Partitions: %d", stats["overall"]["partition_count"])
+                    _LOGGER.info(
+                        "Date range: %s to %s",
+                        stats["overall"]["date_range"]["min"],
+                        stats["overall"]["date_range"]["max"],
                     )
 
                 # Print per-utility stats
                 for utility in ["electric", "gas", "water"]:
                     if utility in stats:
                         u_stats = stats[utility]
-                        print(f"\n{utility.upper()}:")
-                        print(f"  Records: {u_stats['total_records']}")
-                        print(
-                            f"  Total: {u_stats['total_usage']:.2f} {u_stats['unit']}"
+                        _LOGGER.info("\n%s:", utility.upper())
+                        _LOGGER.info("  Records: %d", u_stats["total_records"])
+                        _LOGGER.info(
+                            "  Total: %.2f %s", u_stats["total_usage"], u_stats["unit"]
                         )
-                        print(
-                            f"  Average: {u_stats['avg_usage']:.2f} {u_stats['unit']}"
+                        _LOGGER.info(
+                            "  Average: %.2f %s", u_stats["avg_usage"], u_stats["unit"]
                         )
 
         # Save to file if requested
         if args.output:
-            with open(args.output, "w") as f:
-                json.dump(usage_data, f, indent=2)
-            print(f"\n✓ JSON data saved to {args.output}")
+            # Encoded in one call and written at once; json.dump would issue
+            # a write per encoded chunk
+            with open(args.output, "wb") as f:
+                f.write(encode_json(usage_data, indent=True))
+            _LOGGER.info("\n✓ JSON data saved to %s", args.output)
         elif args.no_save:
             # Print formatted JSON to console if not saving to Delta
-            print("\nData preview:")
-            print(
-                json.dumps(usage_data, indent=2)[:1000] + "..."
-                if len(str(usage_data)) > 1000
-                else json.dumps(usage_data, indent=2)
-            )
+            encoded = encode_json(usage_data, indent=True).decode()
+            _LOGGER.info("\nData preview:")
+            _LOGGER.info("%s", encoded[:1000] + ("..." if len(encoded) > 1000 else ""))
     else:
-        print("\n✗ Failed to retrieve usage data.")
+        _LOGGER.error("\n✗ Failed to retrieve usage data.")
         sys.exit(1)
 
 